@@ -46,8 +46,9 @@ class ChainValidator:
                 continue
             
             # Check plugin compliance
-            if hasattr(plugin, 'compliance_status') and not plugin.compliance_status.get("compliant", False):
-                warnings.append(f"Plugin '{node.plugin_id}' is not compliant: {plugin.compliance_status.get('error', 'Unknown error')}")
+            compliance_status = self.plugin_manager.get_compliance_status(plugin)
+            if not compliance_status.compliant:
+                warnings.append(f"Plugin '{node.plugin_id}' is not compliant: {compliance_status.error or 'Unknown error'}")
         
         # Validate connections
         connection_sources = set()
@@ -140,8 +141,8 @@ class ChainValidator:
                 return
             
             # Get plugin classes to access response models
-            source_class = self.plugin_manager.loader.get_plugin_class(source_node.plugin_id)
-            target_class = self.plugin_manager.loader.get_plugin_class(target_node.plugin_id)
+            source_class = self.plugin_manager.get_plugin_class(source_node.plugin_id)
+            target_class = self.plugin_manager.get_plugin_class(target_node.plugin_id)
             
             if source_class and target_class:
                 source_model = source_class.get_response_model()
@@ -314,13 +315,8 @@ class ChainExecutor:
         # Execute plugin
         plugin_input = PluginInput(plugin_id=node.plugin_id, data=input_data)
         
-        # Run plugin execution in a thread to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, 
-            self.plugin_manager.execute_plugin, 
-            plugin_input
-        )
+        # Run plugin execution on the plugin worker pool to avoid blocking
+        result = await self.plugin_manager.execute_plugin_async(plugin_input)
         
         if not result.success:
             raise Exception(f"Plugin {node.plugin_id} failed: {result.error}")
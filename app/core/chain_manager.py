@@ -1,4 +1,5 @@
 import uuid
+import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -45,21 +46,31 @@ class ChainManager:
         """Save chain to storage"""
         return self.storage.save_chain(chain)
     
+    async def asave_chain(self, chain: ChainDefinition) -> bool:
+        """Save chain to storage without blocking the event loop"""
+        return await self.storage.asave_chain(chain)
+    
     def load_chain(self, chain_id: str) -> Optional[ChainDefinition]:
         """Load chain by ID"""
         return self.storage.load_chain(chain_id)
     
-    def list_chains(self, tags: List[str] = None, template_only: bool = False) -> List[ChainDefinition]:
+    def list_chains(self, tags: List[str] = None, template_only: bool = False,
+                    limit: int = None) -> List[ChainDefinition]:
         """List all chains with optional filtering"""
-        return self.storage.list_chains(tags=tags, template_only=template_only)
+        return self.storage.list_chains(tags=tags, template_only=template_only, limit=limit)
+    
+    def list_chain_summaries(self, tags: List[str] = None, template_only: bool = False,
+                             limit: int = None) -> List[Dict[str, Any]]:
+        """List lightweight chain summaries (name, tags, counts, timestamps)"""
+        return self.storage.list_chain_summaries(tags=tags, template_only=template_only, limit=limit)
     
     def delete_chain(self, chain_id: str) -> bool:
         """Delete chain by ID"""
         return self.storage.delete_chain(chain_id)
     
-    def search_chains(self, query: str = "", tags: List[str] = None) -> List[Dict[str, Any]]:
+    def search_chains(self, query: str = "", tags: List[str] = None, limit: int = None) -> List[Dict[str, Any]]:
         """Search chains by query and tags"""
-        return self.storage.search_chains(query=query, tags=tags)
+        return self.storage.search_chains(query=query, tags=tags, limit=limit)
     
     def duplicate_chain(self, chain_id: str, new_name: str = None) -> Optional[ChainDefinition]:
         """Duplicate an existing chain"""
@@ -94,7 +105,7 @@ class ChainManager:
     
     async def execute_chain(self, chain_id: str, input_data: Dict[str, Any]) -> ChainExecutionResult:
         """Execute a chain by ID"""
-        chain = self.load_chain(chain_id)
+        chain = await asyncio.to_thread(self.load_chain, chain_id)
         if not chain:
             raise ValueError(f"Chain {chain_id} not found")
         
@@ -102,7 +113,7 @@ class ChainManager:
         result = await self.executor.execute_chain(chain, input_data)
         
         # Save execution result
-        self.storage.save_execution_result(result)
+        await self.storage.asave_execution_result(result)
         
         return result
     
@@ -154,9 +165,13 @@ class ChainManager:
         success = self.storage.save_template(template)
         return template if success else None
     
-    def list_templates(self, category: str = None) -> List[ChainTemplate]:
+    def list_templates(self, category: str = None, limit: int = None) -> List[ChainTemplate]:
         """List all templates"""
-        return self.storage.list_templates(category=category)
+        return self.storage.list_templates(category=category, limit=limit)
+    
+    def list_template_summaries(self, category: str = None, limit: int = None) -> List[Dict[str, Any]]:
+        """List lightweight template summaries (name, category, difficulty)"""
+        return self.storage.list_template_summaries(category=category, limit=limit)
     
     def load_template(self, template_id: str) -> Optional[ChainTemplate]:
         """Load template by ID"""
@@ -267,7 +282,7 @@ class ChainManager:
             return {}
         
         # Get plugin class and response model
-        plugin_class = self.plugin_manager.loader.get_plugin_class(plugin_id)
+        plugin_class = self.plugin_manager.get_plugin_class(plugin_id)
         if not plugin_class:
             return {}
         
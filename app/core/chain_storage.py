@@ -1,10 +1,32 @@
-import json
+import asyncio
+import atexit
+import heapq
+import mmap
+import os
 import sqlite3
+import threading
 import uuid
+import weakref
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Any, Tuple, Set
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from pydantic import BaseModel
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 from ..models.chain import (
     ChainDefinition, ChainExecutionResult, ChainTemplate, 
@@ -12,6 +34,234 @@ from ..models.chain import (
 )
 
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to pretty-printed UTF-8 JSON bytes"""
+    return orjson.dumps(obj, option=_JSON_OPTIONS)
+
+
+def _dump_model(model: BaseModel) -> bytes:
+    """Serialize a model straight to JSON bytes via pydantic's core, skipping the dict round-trip"""
+    return model.model_dump_json(indent=2).encode("utf-8")
+
+
+def _atomic_write(path: Path, data: bytes, fsync: bool = True):
+    """Write via a temp file and os.replace so readers never see a torn file"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _loads(buf) -> Any:
+    """Parse JSON from bytes or str"""
+    return orjson.loads(buf)
+
+
+# Nested string values at least this long and repeated this often are stored once per execution file
+_INTERN_MIN_LENGTH = 12
+_INTERN_MIN_COUNT = 3
+_STRING_TABLE_KEY = "$strings"
+_REF_KEY = "$ref"
+
+
+def _pack_strings(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace repeated nested strings with {"$ref": i} pointing into a "$strings" table"""
+    counts: Dict[str, int] = {}
+    
+    def count(value) -> bool:
+        if isinstance(value, str):
+            if len(value) >= _INTERN_MIN_LENGTH:
+                counts[value] = counts.get(value, 0) + 1
+        elif isinstance(value, dict):
+            # A literal {"$ref": ...} would be ambiguous on read, so leave such data as is
+            if _REF_KEY in value:
+                return False
+            return all(count(item) for item in value.values())
+        elif isinstance(value, list):
+            return all(count(item) for item in value)
+        return True
+    
+    # Top-level scalars (ids, timestamps) stay plain so they can be read without unpacking
+    nested = [key for key, value in data.items() if isinstance(value, (dict, list))]
+    if not all(count(data[key]) for key in nested):
+        return data
+    
+    strings = [value for value, n in counts.items() if n >= _INTERN_MIN_COUNT]
+    if not strings:
+        return data
+    refs = {value: i for i, value in enumerate(strings)}
+    
+    def pack(value):
+        if isinstance(value, str):
+            i = refs.get(value)
+            return value if i is None else {_REF_KEY: i}
+        if isinstance(value, dict):
+            return {key: pack(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [pack(item) for item in value]
+        return value
+    
+    packed = dict(data)
+    for key in nested:
+        packed[key] = pack(data[key])
+    packed[_STRING_TABLE_KEY] = strings
+    return packed
+
+
+def _unpack_strings(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _pack_strings; data without a string table is returned unchanged"""
+    strings = data.pop(_STRING_TABLE_KEY, None)
+    if strings is None:
+        return data
+    
+    def unpack(value):
+        if isinstance(value, dict):
+            if len(value) == 1 and _REF_KEY in value:
+                return strings[value[_REF_KEY]]
+            return {key: unpack(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [unpack(item) for item in value]
+        return value
+    
+    return {key: unpack(value) for key, value in data.items()}
+
+
+# Execution files are write-once and read rarely, so they are stored zstd-compressed when possible
+_ZSTD_LEVEL = 3
+_ZSTD_SUFFIX = ".zst"
+
+# zstd contexts are reusable but not thread-safe, so each thread keeps its own pair
+_zstd_contexts = threading.local()
+
+
+def _zstd_compressor() -> "zstandard.ZstdCompressor":
+    """This thread's reusable compressor"""
+    compressor = getattr(_zstd_contexts, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_contexts.compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return compressor
+
+
+def _zstd_decompressor() -> "zstandard.ZstdDecompressor":
+    """This thread's reusable decompressor"""
+    decompressor = getattr(_zstd_contexts, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_contexts.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def _load_execution_file(path: Path) -> Any:
+    """Parse an execution file, decompressing it if it was stored with zstd"""
+    if path.suffix == _ZSTD_SUFFIX:
+        return _loads(_zstd_decompressor().decompress(path.read_bytes()))
+    return _load_file(path)
+
+
+def _ordered(items, key, limit: Optional[int] = None, reverse: bool = False) -> list:
+    """Sort items, or select just the first `limit` of them in O(N log K)"""
+    if limit is None:
+        return sorted(items, key=key, reverse=reverse)
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(limit, items, key=key)
+
+
+# Lowercased copies kept in the metadata index for search only
+_SEARCH_FIELDS = frozenset({"name_lc", "description_lc"})
+
+
+def _summary(chain_id: str, chain_meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Public view of a metadata entry (without the search-only fields)"""
+    summary = {"id": chain_id}
+    summary.update((k, v) for k, v in chain_meta.items() if k not in _SEARCH_FIELDS)
+    return summary
+
+
+# Upper bound on concurrent async disk writes
+_MAX_CONCURRENT_WRITES = 10
+
+# Below this size a plain read() is cheaper than setting up a mapping
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+# Window in which repeated index saves are coalesced into a single write + fsync
+_GROUP_COMMIT_DELAY = 0.01
+
+
+class _GroupCommitter:
+    """Coalesces writes submitted within a short window into one write per key
+    
+    A submitted write reaches disk up to `delay` seconds later, when flush() is
+    called, or at interpreter exit; a crash inside that window loses it.
+    """
+    
+    def __init__(self, delay: float = _GROUP_COMMIT_DELAY):
+        self.delay = delay
+        self._pending: Dict[Any, Callable[[], None]] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        _committers.add(self)
+    
+    def submit(self, key: Any, write: Callable[[], None]):
+        """Queue a write, replacing any not yet flushed for the same key"""
+        with self._lock:
+            self._pending[key] = write
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def is_pending(self, key: Any) -> bool:
+        """Check whether a write for the key has not reached disk yet"""
+        with self._lock:
+            return key in self._pending
+    
+    def flush(self):
+        """Run all queued writes now"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = list(self._pending.items())
+        
+        for key, write in pending:
+            write()
+            # Keep the key pending if a newer write was queued while this one ran
+            with self._lock:
+                if self._pending.get(key) is write:
+                    del self._pending[key]
+
+
+# Live committers, flushed by one exit hook without keeping them (or their storages) alive
+_committers: "weakref.WeakSet[_GroupCommitter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_committers():
+    """Write every committer's queued writes before the interpreter exits"""
+    for committer in list(_committers):
+        committer.flush()
+
+
+def _load_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping large files instead of copying them into bytes"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _loads(view)
+
+
 class ChainFileStorage:
     """Enhanced file-based storage with metadata indexing"""
     
@@ -21,21 +271,37 @@ class ChainFileStorage:
         self.executions_dir = self.base_dir / "chains" / "executions"
         self.templates_dir = self.base_dir / "chains" / "templates"
         self.metadata_file = self.base_dir / "chains" / "metadata.json"
+        self.template_index_file = self.base_dir / "chains" / "templates_index.json"
+        
+        # Parsed index files keyed by path, each tagged with the file's mtime_ns
+        self._index_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        self._meta_lock = threading.RLock()
+        self._index_committer = _GroupCommitter()
+        
+        # Inverted tag -> chain ids index over the cached metadata, rebuilt lazily
+        self._tag_index: Optional[Dict[str, Set[str]]] = None
+        self._tag_index_source: Optional[Dict[str, Any]] = None
+        
+        # Bounds the number of writes in flight from the async variants
+        self._write_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
         
         # Create directory structure
         for dir_path in [self.chains_dir, self.executions_dir, self.templates_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
     
     def save_chain(self, chain: ChainDefinition) -> bool:
-        """Save chain with metadata tracking"""
+        """Save chain with metadata tracking
+        
+        The chain file is durable on return; its metadata index entry is group-committed
+        and reaches disk within _GROUP_COMMIT_DELAY (call flush() to force it).
+        """
         try:
             # Update timestamps
             chain.updated_at = datetime.now().isoformat()
             
             # Save chain definition
             chain_file = self.chains_dir / f"{chain.id}.json"
-            with open(chain_file, 'w', encoding='utf-8') as f:
-                json.dump(chain.dict(), f, indent=2, ensure_ascii=False)
+            _atomic_write(chain_file, _dump_model(chain))
             
             # Update metadata index
             self._update_metadata_index(chain)
@@ -45,6 +311,11 @@ class ChainFileStorage:
             print(f"Failed to save chain {chain.id}: {e}")
             return False
     
+    async def asave_chain(self, chain: ChainDefinition) -> bool:
+        """Save chain off the event loop"""
+        async with self._write_semaphore:
+            return await asyncio.to_thread(self.save_chain, chain)
+    
     def load_chain(self, chain_id: str) -> Optional[ChainDefinition]:
         """Load chain definition from disk"""
         try:
@@ -52,33 +323,80 @@ class ChainFileStorage:
             if not chain_file.exists():
                 return None
                 
-            with open(chain_file, 'r', encoding='utf-8') as f:
-                chain_data = json.load(f)
+            chain_data = _load_file(chain_file)
             return ChainDefinition(**chain_data)
             
         except Exception as e:
             print(f"Failed to load chain {chain_id}: {e}")
             return None
     
-    def list_chains(self, tags: List[str] = None, template_only: bool = False) -> List[ChainDefinition]:
+    def list_chains(self, tags: List[str] = None, template_only: bool = False,
+                    limit: int = None) -> List[ChainDefinition]:
         """List all available chains with optional filtering"""
-        chains = []
-        metadata = self._load_metadata_index()
+        # Order by the indexed timestamp so only the requested page of files is read
+        entries = _ordered(
+            self._filter_metadata(tags, template_only),
+            key=lambda entry: entry[1].get("updated_at", ""), limit=limit, reverse=True
+        )
+        if not entries:
+            return []
         
-        for chain_id, chain_meta in metadata.items():
-            # Filter by template status
-            if template_only and not chain_meta.get("is_template", False):
-                continue
-                
-            # Filter by tags
-            if tags and not any(tag in chain_meta.get("tags", []) for tag in tags):
-                continue
+        # Overlap the per-file open/read syscalls
+        chain_ids = [chain_id for chain_id, _ in entries]
+        with ThreadPoolExecutor(max_workers=min(16, len(chain_ids))) as pool:
+            return [chain for chain in pool.map(self.load_chain, chain_ids) if chain]
+    
+    def list_chain_summaries(self, tags: List[str] = None, template_only: bool = False,
+                             limit: int = None) -> List[Dict[str, Any]]:
+        """List chain summaries straight from the metadata index (no per-chain file reads)"""
+        summaries = [
+            _summary(chain_id, chain_meta)
+            for chain_id, chain_meta in self._filter_metadata(tags, template_only)
+        ]
+        return _ordered(summaries, key=lambda x: x.get("updated_at", ""), limit=limit, reverse=True)
+    
+    def _filter_metadata(self, tags: List[str] = None, template_only: bool = False) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return (chain_id, metadata) pairs matching the template/tag filters"""
+        with self._meta_lock:
+            metadata = self._load_metadata_index()
             
-            chain = self.load_chain(chain_id)
-            if chain:
-                chains.append(chain)
+            if tags:
+                # Any-tag match is a union over the inverted index
+                tag_index = self._get_tag_index(metadata)
+                candidate_ids = set().union(*(tag_index.get(tag, ()) for tag in tags))
+                entries = [(chain_id, metadata[chain_id]) for chain_id in candidate_ids if chain_id in metadata]
+            else:
+                entries = list(metadata.items())
         
-        return sorted(chains, key=lambda x: x.updated_at, reverse=True)
+        if template_only:
+            entries = [(chain_id, chain_meta) for chain_id, chain_meta in entries
+                       if chain_meta.get("is_template", False)]
+        
+        return entries
+    
+    def _get_tag_index(self, metadata: Dict[str, Any]) -> Dict[str, Set[str]]:
+        """Return the inverted tag index, rebuilding it whenever the metadata was re-read"""
+        if self._tag_index is None or self._tag_index_source is not metadata:
+            tag_index: Dict[str, Set[str]] = {}
+            for chain_id, chain_meta in metadata.items():
+                for tag in chain_meta.get("tags", []):
+                    tag_index.setdefault(tag, set()).add(chain_id)
+            self._tag_index = tag_index
+            self._tag_index_source = metadata
+        return self._tag_index
+    
+    def _reindex_tags(self, metadata: Dict[str, Any], chain_id: str, old_tags: List[str], new_tags: List[str]):
+        """Move a chain between tag buckets in the inverted index"""
+        if self._tag_index is None or self._tag_index_source is not metadata:
+            return
+        for tag in old_tags:
+            bucket = self._tag_index.get(tag)
+            if bucket is not None:
+                bucket.discard(chain_id)
+                if not bucket:
+                    del self._tag_index[tag]
+        for tag in new_tags:
+            self._tag_index.setdefault(tag, set()).add(chain_id)
     
     def delete_chain(self, chain_id: str) -> bool:
         """Delete chain and update metadata"""
@@ -88,10 +406,12 @@ class ChainFileStorage:
                 chain_file.unlink()
             
             # Update metadata index
-            metadata = self._load_metadata_index()
-            if chain_id in metadata:
-                del metadata[chain_id]
-                self._save_metadata_index(metadata)
+            with self._meta_lock:
+                metadata = self._load_metadata_index()
+                if chain_id in metadata:
+                    removed = metadata.pop(chain_id)
+                    self._reindex_tags(metadata, chain_id, removed.get("tags", []), [])
+                    self._save_metadata_index(metadata)
             
             return True
             
@@ -99,29 +419,41 @@ class ChainFileStorage:
             print(f"Failed to delete chain {chain_id}: {e}")
             return False
     
-    def search_chains(self, query: str = "", tags: List[str] = None) -> List[Dict[str, Any]]:
-        """Search chains by name, description, or tags"""
-        metadata = self._load_metadata_index()
+    def search_chains(self, query: str = "", tags: List[str] = None, limit: int = None,
+                      chain_ids: List[str] = None) -> List[Dict[str, Any]]:
+        """Search chains by name, description, or tags, optionally only among the given chain ids"""
         results = []
+        query_lower = query.lower()
         
-        for chain_id, chain_meta in metadata.items():
+        if chain_ids is None:
+            # Tag filtering narrows the candidates through the inverted index
+            entries = self._filter_metadata(tags)
+        else:
+            with self._meta_lock:
+                metadata = self._load_metadata_index()
+                entries = [(chain_id, metadata[chain_id]) for chain_id in chain_ids if chain_id in metadata]
+            if tags:
+                wanted = set(tags)
+                entries = [(chain_id, chain_meta) for chain_id, chain_meta in entries
+                           if wanted.intersection(chain_meta.get("tags", []))]
+        
+        for chain_id, chain_meta in entries:
             # Text search
             if query:
-                query_lower = query.lower()
-                if (query_lower not in chain_meta.get("name", "").lower() and 
-                    query_lower not in chain_meta.get("description", "").lower()):
+                # Entries written before the *_lc fields existed are lowered on the fly
+                name_lc = chain_meta.get("name_lc")
+                if name_lc is None:
+                    name_lc = chain_meta.get("name", "").lower()
+                description_lc = chain_meta.get("description_lc")
+                if description_lc is None:
+                    description_lc = (chain_meta.get("description") or "").lower()
+                
+                if query_lower not in name_lc and query_lower not in description_lc:
                     continue
             
-            # Tag filtering
-            if tags and not any(tag in chain_meta.get("tags", []) for tag in tags):
-                continue
-            
-            results.append({
-                "id": chain_id,
-                **chain_meta
-            })
+            results.append(_summary(chain_id, chain_meta))
         
-        return sorted(results, key=lambda x: x.get("updated_at", ""), reverse=True)
+        return _ordered(results, key=lambda x: x.get("updated_at", ""), limit=limit, reverse=True)
     
     def save_execution_result(self, result: ChainExecutionResult) -> bool:
         """Save execution results for history/debugging"""
@@ -133,8 +465,15 @@ class ChainFileStorage:
             
             # Save execution result
             exec_file = date_dir / f"{result.execution_id}.json"
-            with open(exec_file, 'w', encoding='utf-8') as f:
-                json.dump(result.dict(), f, indent=2, ensure_ascii=False)
+            data = result.model_dump()
+            packed = _pack_strings(data)
+            # Packed files are written compact; indentation would eat the savings
+            payload = _dump_model(result) if packed is data else orjson.dumps(packed)
+            if ZSTD_AVAILABLE:
+                exec_file = exec_file.with_name(exec_file.name + _ZSTD_SUFFIX)
+                payload = _zstd_compressor().compress(payload)
+            # No fsync: the database row is the durable copy of an execution
+            _atomic_write(exec_file, payload, fsync=False)
                 
             return True
             
@@ -142,6 +481,11 @@ class ChainFileStorage:
             print(f"Failed to save execution result: {e}")
             return False
     
+    async def asave_execution_result(self, result: ChainExecutionResult) -> bool:
+        """Save execution result off the event loop"""
+        async with self._write_semaphore:
+            return await asyncio.to_thread(self.save_execution_result, result)
+    
     def get_execution_history(self, chain_id: str, limit: int = 50) -> List[ChainExecutionResult]:
         """Get execution history for a chain"""
         executions = []
@@ -151,10 +495,17 @@ class ChainFileStorage:
             if not date_dir.is_dir():
                 continue
                 
-            for exec_file in sorted(date_dir.glob("*.json"), reverse=True):
+            exec_files = list(date_dir.glob("*.json"))
+            if ZSTD_AVAILABLE:
+                exec_files.extend(date_dir.glob(f"*.json{_ZSTD_SUFFIX}"))
+            
+            for exec_file in sorted(exec_files, key=lambda path: path.name, reverse=True):
                 try:
-                    with open(exec_file, 'r', encoding='utf-8') as f:
-                        exec_data = json.load(f)
+                    # Reject other chains' executions without parsing the whole file
+                    if IJSON_AVAILABLE and not self._execution_file_matches(exec_file, chain_id):
+                        continue
+                    
+                    exec_data = _unpack_strings(_load_execution_file(exec_file))
                     
                     if exec_data.get("chain_id") == chain_id:
                         executions.append(ChainExecutionResult(**exec_data))
@@ -167,18 +518,36 @@ class ChainFileStorage:
         
         return executions
     
+    @staticmethod
+    def _execution_file_matches(exec_file: Path, chain_id: str) -> bool:
+        """Stream an execution file only as far as its top-level chain_id"""
+        with open(exec_file, 'rb') as f:
+            if exec_file.suffix == _ZSTD_SUFFIX:
+                f = _zstd_decompressor().stream_reader(f)
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "chain_id" and event == "string":
+                    return value == chain_id
+        return False
+    
     def save_template(self, template: ChainTemplate) -> bool:
-        """Save chain template"""
+        """Save chain template; like save_chain, its index entry is group-committed"""
         try:
             template_file = self.templates_dir / f"{template.id}.json"
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(template.dict(), f, indent=2, ensure_ascii=False)
+            _atomic_write(template_file, _dump_model(template))
+            
+            # Update template index
+            self._update_template_index(template)
             return True
             
         except Exception as e:
             print(f"Failed to save template {template.id}: {e}")
             return False
     
+    async def asave_template(self, template: ChainTemplate) -> bool:
+        """Save chain template off the event loop"""
+        async with self._write_semaphore:
+            return await asyncio.to_thread(self.save_template, template)
+    
     def load_template(self, template_id: str) -> Optional[ChainTemplate]:
         """Load chain template"""
         try:
@@ -186,33 +555,66 @@ class ChainFileStorage:
             if not template_file.exists():
                 return None
                 
-            with open(template_file, 'r', encoding='utf-8') as f:
-                template_data = json.load(f)
+            template_data = _load_file(template_file)
             return ChainTemplate(**template_data)
             
         except Exception as e:
             print(f"Failed to load template {template_id}: {e}")
             return None
     
-    def list_templates(self, category: str = None) -> List[ChainTemplate]:
+    def list_templates(self, category: str = None, limit: int = None) -> List[ChainTemplate]:
         """List all available templates"""
         templates = []
         
-        for template_file in self.templates_dir.glob("*.json"):
-            try:
-                template = self.load_template(template_file.stem)
-                if template and (not category or template.category == category):
-                    templates.append(template)
-            except Exception:
-                continue
+        for summary in self.list_template_summaries(category, limit):
+            template = self.load_template(summary["id"])
+            if template:
+                templates.append(template)
         
-        return sorted(templates, key=lambda x: x.name)
+        return templates
+    
+    def list_template_summaries(self, category: str = None, limit: int = None) -> List[Dict[str, Any]]:
+        """List template summaries straight from the template index"""
+        summaries = [
+            {"id": template_id, **template_meta}
+            for template_id, template_meta in self._load_template_index().items()
+            if not category or template_meta.get("category") == category
+        ]
+        return _ordered(summaries, key=lambda x: x.get("name", ""), limit=limit)
+    
+    def _update_template_index(self, template: ChainTemplate):
+        """Maintain the template index used for listings"""
+        with self._meta_lock:
+            index = self._load_template_index()
+            index[template.id] = self._template_index_entry(template)
+            self._save_index(self.template_index_file, index)
+    
+    def _load_template_index(self) -> Dict[str, Any]:
+        """Load the template index, building it from the template files the first time"""
+        with self._meta_lock:
+            if self.template_index_file.exists() or self._index_committer.is_pending(self.template_index_file):
+                return self._load_index(self.template_index_file)
+            
+            index = {}
+            for template_file in self.templates_dir.glob("*.json"):
+                template = self.load_template(template_file.stem)
+                if template:
+                    index[template.id] = self._template_index_entry(template)
+            self._save_index(self.template_index_file, index)
+            return index
+    
+    @staticmethod
+    def _template_index_entry(template: ChainTemplate) -> Dict[str, Any]:
+        """Fields of a template kept in the template index"""
+        return {
+            "name": template.name,
+            "category": template.category,
+            "difficulty_level": template.difficulty_level
+        }
     
     def _update_metadata_index(self, chain: ChainDefinition):
         """Maintain searchable metadata index"""
-        metadata = self._load_metadata_index()
-        
-        metadata[chain.id] = {
+        entry = {
             "name": chain.name,
             "description": chain.description,
             "version": chain.version,
@@ -223,28 +625,120 @@ class ChainFileStorage:
             "author": chain.author,
             "node_count": len(chain.nodes),
             "connection_count": len(chain.connections),
-            "plugin_types": list(set(node.plugin_id for node in chain.nodes if node.plugin_id))
+            "plugin_types": list(set(node.plugin_id for node in chain.nodes if node.plugin_id)),
+            "name_lc": chain.name.lower(),
+            "description_lc": (chain.description or "").lower()
         }
         
-        self._save_metadata_index(metadata)
+        with self._meta_lock:
+            metadata = self._load_metadata_index()
+            previous = metadata.get(chain.id)
+            self._reindex_tags(metadata, chain.id, previous.get("tags", []) if previous else [], entry["tags"])
+            metadata[chain.id] = entry
+            self._save_metadata_index(metadata)
     
     def _load_metadata_index(self) -> Dict[str, Any]:
         """Load metadata index"""
-        try:
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        return {}
+        return self._load_index(self.metadata_file)
     
     def _save_metadata_index(self, metadata: Dict[str, Any]):
         """Save metadata index"""
+        self._save_index(self.metadata_file, metadata)
+    
+    def _load_index(self, index_file: Path) -> Dict[str, Any]:
+        """Load a JSON index file, reusing the cached copy while the file is unchanged"""
+        with self._meta_lock:
+            # A queued save is newer than whatever is on disk
+            cached = self._index_cache.get(index_file)
+            if cached and self._index_committer.is_pending(index_file):
+                return cached[1]
+            
+            try:
+                mtime_ns = index_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._index_cache.pop(index_file, None)
+                return {}
+            
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+            
+            try:
+                data = _load_file(index_file)
+            except Exception:
+                return {}
+            
+            self._index_cache[index_file] = (mtime_ns, data)
+            return data
+    
+    def _save_index(self, index_file: Path, data: Dict[str, Any]):
+        """Cache an index and queue it for a group-committed write"""
+        with self._meta_lock:
+            cached = self._index_cache.get(index_file)
+            self._index_cache[index_file] = (cached[0] if cached else -1, data)
+            self._index_committer.submit(index_file, lambda: self._write_index(index_file, data))
+    
+    def _write_index(self, index_file: Path, data: Dict[str, Any]):
+        """Atomically write an index file and refresh its cache entry"""
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            with self._meta_lock:
+                payload = _dumps(data)
+            _atomic_write(index_file, payload)
+            with self._meta_lock:
+                cached = self._index_cache.get(index_file)
+                if cached and cached[1] is data:
+                    self._index_cache[index_file] = (index_file.stat().st_mtime_ns, data)
         except Exception as e:
-            print(f"Failed to save metadata index: {e}")
+            # Drop the cache so the next read reflects what is actually on disk
+            with self._meta_lock:
+                self._index_cache.pop(index_file, None)
+            print(f"Failed to save index {index_file.name}: {e}")
+    
+    def flush(self):
+        """Write any queued index updates to disk now"""
+        self._index_committer.flush()
+
+
+# Per-connection tuning: 64MB page cache, 256MB mmap window, in-memory temp tables
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+"""
+
+# Queries shorter than this cannot be answered by the trigram index
+_TRIGRAM_LENGTH = 3
+
+# Executions newer than this many months stay in the hot chain_executions table
+_HOT_EXECUTION_MONTHS = 3
+
+# Same columns as the hot table; the chains table it references is not in the archive database
+_ARCHIVE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS archive.chain_executions (
+        id TEXT PRIMARY KEY,
+        chain_id TEXT,
+        input_data TEXT,
+        output_data TEXT,
+        node_results TEXT,
+        execution_time REAL,
+        success BOOLEAN,
+        error_message TEXT,
+        execution_graph TEXT,
+        started_at TIMESTAMP,
+        completed_at TIMESTAMP
+    )
+"""
+
+
+def _next_month(month: str) -> str:
+    """The YYYY-MM month after the given one"""
+    year, month_number = (int(part) for part in month.split("-"))
+    return f"{year + month_number // 12:04d}-{month_number % 12 + 1:02d}"
+
+
+def _archive_month(archive_path: Path) -> str:
+    """YYYY-MM covered by a chain_executions_YYYY_MM.db archive"""
+    return "-".join(archive_path.stem.split("_")[-2:])
 
 
 class ChainDatabaseStorage:
@@ -253,11 +747,17 @@ class ChainDatabaseStorage:
     def __init__(self, db_path: str = "app/data/chains.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.archive_dir = self.db_path.parent / "archive"
+        self._local = threading.local()
+        self.fts_available = False
         self.init_database()
+        self.compact_executions()
     
     def init_database(self):
         """Initialize SQLite database with required tables"""
         with self.get_connection() as conn:
+            # WAL is persistent in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS chains (
                     id TEXT PRIMARY KEY,
@@ -290,6 +790,12 @@ class ChainDatabaseStorage:
                     FOREIGN KEY (chain_id) REFERENCES chains (id)
                 );
                 
+                -- Which monthly archive each moved execution lives in
+                CREATE TABLE IF NOT EXISTS archived_executions (
+                    id TEXT PRIMARY KEY,
+                    month TEXT NOT NULL
+                );
+                
                 CREATE TABLE IF NOT EXISTS chain_analytics (
                     chain_id TEXT PRIMARY KEY,
                     total_executions INTEGER DEFAULT 0,
@@ -318,57 +824,339 @@ class ChainDatabaseStorage:
                 CREATE INDEX IF NOT EXISTS idx_chains_tags ON chains(tags);
                 CREATE INDEX IF NOT EXISTS idx_chains_updated ON chains(updated_at);
                 CREATE INDEX IF NOT EXISTS idx_executions_chain ON chain_executions(chain_id);
+                CREATE INDEX IF NOT EXISTS idx_executions_chain_started ON chain_executions(chain_id, started_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_executions_date ON chain_executions(started_at);
                 CREATE INDEX IF NOT EXISTS idx_executions_success ON chain_executions(success);
+                -- Covering index so per-chain aggregates never touch the table rows
+                CREATE INDEX IF NOT EXISTS idx_exec_chain_cover ON chain_executions(chain_id, success, execution_time, completed_at);
+                
+                ANALYZE;
             """)
+            
+            # Trigram index over chain name/description for substring search; FTS5 is a compile-time option
+            try:
+                existing = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'chains_fts'"
+                ).fetchone()
+                if existing and "trigram" not in existing[0]:
+                    # Word-tokenized index from an earlier version; rebuilt on startup
+                    conn.execute("DROP TABLE chains_fts")
+                conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS chains_fts USING fts5(
+                        chain_id UNINDEXED, name, description,
+                        tokenize='trigram'
+                    )
+                """)
+                self.fts_available = True
+            except sqlite3.OperationalError as e:
+                print(f"Full-text search unavailable: {e}")
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to the database"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+    
+    @contextmanager
+    def get_connection(self):
+        """Context manager for database connections (one reused handle per thread)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
+    
+    _INSERT_EXECUTION_SQL = """
+        INSERT OR REPLACE INTO chain_executions (
+            id, chain_id, input_data, output_data, node_results,
+            execution_time, success, error_message, execution_graph,
+            started_at, completed_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _execution_row(result: ChainExecutionResult) -> tuple:
+        """Build the chain_executions row for an execution result"""
+        return (
+            result.execution_id,
+            result.chain_id,
+            orjson.dumps({}).decode(),  # input_data would need to be passed separately
+            orjson.dumps(result.results).decode(),
+            orjson.dumps(result.node_results).decode(),
+            result.execution_time,
+            result.success,
+            result.error,
+            orjson.dumps(result.execution_graph).decode(),
+            result.started_at,
+            result.completed_at
+        )
     
     def save_execution_to_db(self, result: ChainExecutionResult) -> bool:
         """Save execution result to database"""
         try:
             with self.get_connection() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO chain_executions (
-                        id, chain_id, input_data, output_data, node_results,
-                        execution_time, success, error_message, execution_graph,
-                        started_at, completed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    result.execution_id,
-                    result.chain_id,
-                    json.dumps({}),  # input_data would need to be passed separately
-                    json.dumps(result.results),
-                    json.dumps(result.node_results),
-                    result.execution_time,
-                    result.success,
-                    result.error,
-                    json.dumps(result.execution_graph),
-                    result.started_at,
-                    result.completed_at
-                ))
-                
-                # Update analytics
-                self._update_chain_analytics(conn, result.chain_id)
-                
+                archived = self._save_executions(conn, [result])
+            self._purge_archived(archived)
             return True
             
         except Exception as e:
             print(f"Failed to save execution to database: {e}")
             return False
     
+    def save_executions_batch(self, results: List[ChainExecutionResult]) -> bool:
+        """Save many execution results in a single transaction"""
+        # Last write wins for duplicate execution ids, as with INSERT OR REPLACE
+        unique = list({result.execution_id: result for result in results}.values())
+        if not unique:
+            return True
+        
+        try:
+            with self.get_connection() as conn:
+                archived = self._save_executions(conn, unique)
+            self._purge_archived(archived)
+            return True
+            
+        except Exception as e:
+            print(f"Failed to save execution batch to database: {e}")
+            return False
+    
+    def _save_executions(self, conn: sqlite3.Connection,
+                         results: List[ChainExecutionResult]) -> Dict[Path, List[str]]:
+        """Write executions and their analytics; returns archived copies to purge after commit"""
+        execution_ids = [result.execution_id for result in results]
+        previous = self._existing_executions(conn, execution_ids)
+        archived = self._archived_executions(conn, [i for i in execution_ids if i not in previous])
+        for rows in archived.values():
+            previous.update(rows)
+        
+        conn.executemany(self._INSERT_EXECUTION_SQL, (self._execution_row(r) for r in results))
+        
+        # Update analytics
+        self._apply_execution_deltas(conn, results, previous)
+        
+        archived_ids = [execution_id for rows in archived.values() for execution_id in rows]
+        for i in range(0, len(archived_ids), 500):
+            batch_ids = archived_ids[i:i + 500]
+            conn.execute(
+                f"DELETE FROM archived_executions WHERE id IN ({','.join('?' * len(batch_ids))})",
+                batch_ids
+            )
+        return {archive_path: list(rows) for archive_path, rows in archived.items()}
+    
+    def _purge_archived(self, archived: Dict[Path, List[str]]):
+        """Drop archived copies of executions that now live in the hot table again"""
+        for archive_path, execution_ids in archived.items():
+            try:
+                with closing(sqlite3.connect(archive_path)) as archive:
+                    with archive:
+                        for i in range(0, len(execution_ids), 500):
+                            batch_ids = execution_ids[i:i + 500]
+                            archive.execute(
+                                f"DELETE FROM chain_executions WHERE id IN ({','.join('?' * len(batch_ids))})",
+                                batch_ids
+                            )
+            except Exception as e:
+                # The stale copy is replaced when its month is archived again
+                print(f"Failed to purge archived executions from {archive_path.name}: {e}")
+    
+    _HISTORY_SQL = """
+        SELECT id, chain_id, output_data, node_results, execution_time,
+               success, error_message, execution_graph, started_at, completed_at
+        FROM chain_executions
+        WHERE chain_id = ?
+        ORDER BY started_at DESC
+        LIMIT ?
+    """
+    
+    @staticmethod
+    def _row_to_execution(row: sqlite3.Row) -> ChainExecutionResult:
+        """Rebuild an execution result from a chain_executions row"""
+        return ChainExecutionResult(
+            success=bool(row['success']),
+            chain_id=row['chain_id'],
+            execution_id=row['id'],
+            results=_loads(row['output_data'] or '{}'),
+            node_results=_loads(row['node_results'] or '{}'),
+            execution_time=row['execution_time'] or 0.0,
+            error=row['error_message'],
+            execution_graph=_loads(row['execution_graph'] or '[]'),
+            started_at=row['started_at'],
+            completed_at=row['completed_at']
+        )
+    
+    def get_execution_history(self, chain_id: str, limit: int = 50) -> Optional[List[ChainExecutionResult]]:
+        """Get execution history for a chain via the (chain_id, started_at) index"""
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute(self._HISTORY_SQL, (chain_id, limit)).fetchall()
+            
+            # Older executions live in the monthly archives, newest month first. Re-saved
+            # executions can put old rows in the hot table, so everything is merged by start time.
+            for archive_path in sorted(self.archive_dir.glob("chain_executions_*.db"), reverse=True):
+                if len(rows) >= limit:
+                    rows = _ordered(rows, key=lambda row: row['started_at'] or "", limit=limit, reverse=True)
+                    if (rows[-1]['started_at'] or "") >= _next_month(_archive_month(archive_path)):
+                        break
+                uri = f"{archive_path.resolve().as_uri()}?mode=ro"
+                with closing(sqlite3.connect(uri, uri=True)) as archive:
+                    archive.row_factory = sqlite3.Row
+                    rows.extend(archive.execute(self._HISTORY_SQL, (chain_id, limit)))
+            
+            rows = _ordered(rows, key=lambda row: row['started_at'] or "", limit=limit, reverse=True)
+            return [self._row_to_execution(row) for row in rows]
+                
+        except Exception as e:
+            print(f"Failed to get execution history from database: {e}")
+            return None
+    
+    def has_executions(self) -> bool:
+        """Check whether any execution has been recorded in the database"""
+        try:
+            with self.get_connection() as conn:
+                return conn.execute("SELECT 1 FROM chain_executions LIMIT 1").fetchone() is not None
+        except Exception:
+            return False
+    
+    def index_chain_text(self, chain_id: str, name: str, description: str) -> bool:
+        """Add or refresh a chain's entry in the full-text index"""
+        if not self.fts_available:
+            return False
+        try:
+            with self.get_connection() as conn:
+                conn.execute("DELETE FROM chains_fts WHERE chain_id = ?", (chain_id,))
+                conn.execute(
+                    "INSERT INTO chains_fts (chain_id, name, description) VALUES (?, ?, ?)",
+                    (chain_id, name, description or "")
+                )
+            return True
+        except Exception as e:
+            print(f"Failed to index chain {chain_id} for search: {e}")
+            return False
+    
+    def remove_chain_text(self, chain_id: str) -> bool:
+        """Drop a chain from the full-text index"""
+        if not self.fts_available:
+            return False
+        try:
+            with self.get_connection() as conn:
+                conn.execute("DELETE FROM chains_fts WHERE chain_id = ?", (chain_id,))
+            return True
+        except Exception as e:
+            print(f"Failed to remove chain {chain_id} from search index: {e}")
+            return False
+    
+    def rebuild_chain_text(self, metadata: Dict[str, Any]) -> bool:
+        """Rebuild the full-text index from the chain metadata index"""
+        if not self.fts_available:
+            return False
+        try:
+            with self.get_connection() as conn:
+                conn.execute("DELETE FROM chains_fts")
+                conn.executemany(
+                    "INSERT INTO chains_fts (chain_id, name, description) VALUES (?, ?, ?)",
+                    [
+                        (chain_id, chain_meta.get("name", ""), chain_meta.get("description") or "")
+                        for chain_id, chain_meta in metadata.items()
+                    ]
+                )
+            return True
+        except Exception as e:
+            print(f"Failed to rebuild search index: {e}")
+            return False
+    
+    def count_chain_text(self) -> int:
+        """Number of chains in the full-text index"""
+        if not self.fts_available:
+            return 0
+        try:
+            with self.get_connection() as conn:
+                return conn.execute("SELECT COUNT(*) FROM chains_fts").fetchone()[0]
+        except Exception:
+            return 0
+    
+    def search_chain_ids(self, query: str) -> Optional[List[str]]:
+        """Ids of chains whose name or description may contain the query; None if the index can't tell"""
+        if not self.fts_available or len(query) < _TRIGRAM_LENGTH:
+            return None
+        
+        # A quoted phrase matches the query's trigrams in sequence, i.e. as a substring
+        match = '"' + query.replace('"', '""') + '"'
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute("SELECT chain_id FROM chains_fts WHERE chains_fts MATCH ?", (match,)).fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            print(f"Failed to search chains: {e}")
+            return None
+    
+    def compact_executions(self, keep_months: int = _HOT_EXECUTION_MONTHS) -> int:
+        """Archive executions older than the most recent keep_months months"""
+        now = datetime.now()
+        year, month = divmod(now.year * 12 + now.month - 1 - (keep_months - 1), 12)
+        cutoff = f"{year:04d}-{month + 1:02d}"
+        
+        try:
+            with self.get_connection() as conn:
+                months = [
+                    row[0] for row in conn.execute(
+                        "SELECT DISTINCT substr(started_at, 1, 7) FROM chain_executions WHERE started_at < ?",
+                        (cutoff,)
+                    )
+                ]
+        except Exception as e:
+            print(f"Failed to compact executions: {e}")
+            return 0
+        
+        return sum(self.archive_month(month) for month in months)
+    
+    def archive_month(self, month: str) -> int:
+        """Move one month's executions (YYYY-MM) out of the hot table into its own database"""
+        year, month_number = (int(part) for part in month.split("-"))
+        next_month = _next_month(month)
+        archive_path = self.archive_dir / f"chain_executions_{year:04d}_{month_number:02d}.db"
+        
+        try:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            with self.get_connection() as conn:
+                # ATTACH/DETACH are not allowed inside a transaction
+                conn.commit()
+                conn.execute("ATTACH DATABASE ? AS archive", (str(archive_path),))
+                try:
+                    conn.execute(_ARCHIVE_TABLE_SQL)
+                    conn.execute("""
+                        CREATE INDEX IF NOT EXISTS archive.idx_executions_chain_started
+                        ON chain_executions(chain_id, started_at DESC)
+                    """)
+                    moved = conn.execute("""
+                        INSERT OR REPLACE INTO archive.chain_executions
+                        SELECT * FROM main.chain_executions WHERE started_at >= ? AND started_at < ?
+                    """, (month, next_month)).rowcount
+                    conn.execute("""
+                        INSERT OR REPLACE INTO main.archived_executions (id, month)
+                        SELECT id, ? FROM main.chain_executions WHERE started_at >= ? AND started_at < ?
+                    """, (month, month, next_month))
+                    conn.execute(
+                        "DELETE FROM main.chain_executions WHERE started_at >= ? AND started_at < ?",
+                        (month, next_month)
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.execute("DETACH DATABASE archive")
+            
+            return moved
+            
+        except Exception as e:
+            print(f"Failed to archive executions for {month}: {e}")
+            return 0
+    
     def get_chain_analytics(self, chain_id: str) -> Optional[ChainAnalytics]:
         """Get execution analytics for a chain"""
         try:
@@ -390,8 +1178,8 @@ class ChainDatabaseStorage:
                     average_execution_time=row['average_execution_time'],
                     last_execution=row['last_execution'],
                     success_rate=row['success_rate'],
-                    most_common_errors=json.loads(row['most_common_errors'] or '[]'),
-                    performance_trend=json.loads(row['performance_trend'] or '[]')
+                    most_common_errors=_loads(row['most_common_errors'] or '[]'),
+                    performance_trend=_loads(row['performance_trend'] or '[]')
                 )
                 
         except Exception as e:
@@ -404,14 +1192,15 @@ class ChainDatabaseStorage:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get overall stats
+                # Get overall stats from the running per-chain totals, which also cover archived months
                 cursor.execute("""
                     SELECT 
-                        COUNT(DISTINCT chain_id) as total_chains,
-                        COUNT(*) as total_executions,
-                        AVG(execution_time) as avg_execution_time,
-                        SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_executions
-                    FROM chain_executions
+                        COUNT(*) as total_chains,
+                        SUM(total_executions) as total_executions,
+                        SUM(average_execution_time * total_executions) / SUM(total_executions) as avg_execution_time,
+                        SUM(successful_executions) as successful_executions
+                    FROM chain_analytics
+                    WHERE total_executions > 0
                 """)
                 
                 stats = cursor.fetchone()
@@ -420,11 +1209,10 @@ class ChainDatabaseStorage:
                 cursor.execute("""
                     SELECT 
                         c.name,
-                        COUNT(e.id) as execution_count,
-                        AVG(e.execution_time) as avg_time
+                        COALESCE(a.total_executions, 0) as execution_count,
+                        a.average_execution_time as avg_time
                     FROM chains c
-                    LEFT JOIN chain_executions e ON c.id = e.chain_id
-                    GROUP BY c.id, c.name
+                    LEFT JOIN chain_analytics a ON c.id = a.chain_id
                     ORDER BY execution_count DESC
                     LIMIT 10
                 """)
@@ -443,8 +1231,105 @@ class ChainDatabaseStorage:
             print(f"Failed to get system analytics: {e}")
             return {}
     
+    def _existing_executions(self, conn: sqlite3.Connection, execution_ids: List[str]) -> Dict[str, sqlite3.Row]:
+        """Fetch the rows that are about to be replaced, keyed by execution id"""
+        existing = {}
+        for i in range(0, len(execution_ids), 500):
+            batch_ids = execution_ids[i:i + 500]
+            placeholders = ",".join("?" * len(batch_ids))
+            for row in conn.execute(
+                f"SELECT id, chain_id, success, execution_time FROM chain_executions WHERE id IN ({placeholders})",
+                batch_ids
+            ):
+                existing[row['id']] = row
+        return existing
+    
+    def _archived_executions(self, conn: sqlite3.Connection,
+                             execution_ids: List[str]) -> Dict[Path, Dict[str, sqlite3.Row]]:
+        """Fetch archived rows for the given execution ids, grouped by archive file"""
+        months: Dict[str, List[str]] = {}
+        for i in range(0, len(execution_ids), 500):
+            batch_ids = execution_ids[i:i + 500]
+            placeholders = ",".join("?" * len(batch_ids))
+            for row in conn.execute(
+                f"SELECT id, month FROM archived_executions WHERE id IN ({placeholders})", batch_ids
+            ):
+                months.setdefault(row['month'], []).append(row['id'])
+        
+        archived = {}
+        for month, month_ids in months.items():
+            archive_path = self.archive_dir / f"chain_executions_{month.replace('-', '_')}.db"
+            if not archive_path.exists():
+                continue
+            uri = f"{archive_path.resolve().as_uri()}?mode=ro"
+            with closing(sqlite3.connect(uri, uri=True)) as archive:
+                archive.row_factory = sqlite3.Row
+                rows = {}
+                for i in range(0, len(month_ids), 500):
+                    batch_ids = month_ids[i:i + 500]
+                    placeholders = ",".join("?" * len(batch_ids))
+                    for row in archive.execute(
+                        f"SELECT id, chain_id, success, execution_time FROM chain_executions WHERE id IN ({placeholders})",
+                        batch_ids
+                    ):
+                        rows[row['id']] = row
+            if rows:
+                archived[archive_path] = rows
+        return archived
+    
+    def _apply_execution_deltas(self, conn: sqlite3.Connection, results: List[ChainExecutionResult],
+                                previous: Dict[str, sqlite3.Row]):
+        """Fold saved executions into the per-chain analytics, one update per chain"""
+        deltas: Dict[str, List[Any]] = {}
+        for r in results:
+            old = previous.get(r.execution_id)
+            if old:
+                # A replaced row gives back its contribution before the new one is added
+                delta = deltas.setdefault(old['chain_id'], [0, 0, 0.0, ""])
+                delta[0] -= 1
+                delta[1] -= int(bool(old['success']))
+                delta[2] -= old['execution_time'] or 0.0
+            delta = deltas.setdefault(r.chain_id, [0, 0, 0.0, ""])
+            delta[0] += 1
+            delta[1] += int(r.success)
+            delta[2] += r.execution_time
+            delta[3] = max(delta[3], r.completed_at or "")
+        
+        for chain_id, (count, successful, total_time, last_execution) in deltas.items():
+            self._increment_chain_analytics(conn, chain_id, count, successful, total_time, last_execution)
+    
+    def _increment_chain_analytics(self, conn: sqlite3.Connection, chain_id: str, executions: int,
+                                   successful: int, total_time: float, last_execution: str):
+        """Adjust the chain's running analytics by the given deltas"""
+        cursor = conn.execute("""
+            UPDATE chain_analytics SET
+                total_executions = total_executions + :executions,
+                successful_executions = successful_executions + :successful,
+                failed_executions = failed_executions + :executions - :successful,
+                average_execution_time = CASE WHEN total_executions + :executions > 0
+                    THEN (COALESCE(average_execution_time, 0) * total_executions + :total_time)
+                        / (total_executions + :executions)
+                    ELSE 0 END,
+                last_execution = MAX(COALESCE(last_execution, ''), :last_execution),
+                success_rate = CASE WHEN total_executions + :executions > 0
+                    THEN (successful_executions + :successful) * 100.0 / (total_executions + :executions)
+                    ELSE 0 END,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE chain_id = :chain_id
+        """, {
+            "chain_id": chain_id,
+            "executions": executions,
+            "successful": successful,
+            "total_time": total_time,
+            "last_execution": last_execution
+        })
+        
+        if cursor.rowcount == 0:
+            # No running totals for this chain yet, so build them from its rows
+            self._update_chain_analytics(conn, chain_id)
+    
     def _update_chain_analytics(self, conn: sqlite3.Connection, chain_id: str):
-        """Update analytics for a chain"""
+        """Recompute analytics for a chain from all of its executions"""
         cursor = conn.cursor()
         
         # Calculate new analytics
@@ -490,10 +1375,35 @@ class ChainStorageManager:
     def __init__(self, base_dir: str = "app/data"):
         self.file_storage = ChainFileStorage(base_dir)
         self.db_storage = ChainDatabaseStorage(f"{base_dir}/chains.db")
+        self._sync_search_index()
+    
+    def _sync_search_index(self):
+        """Rebuild the full-text index if it drifted from the metadata index"""
+        if not self.db_storage.fts_available:
+            return
+        metadata = self.file_storage._load_metadata_index()
+        if self.db_storage.count_chain_text() != len(metadata):
+            self.db_storage.rebuild_chain_text(metadata)
     
     def save_chain(self, chain: ChainDefinition) -> bool:
         """Save chain to file storage"""
-        return self.file_storage.save_chain(chain)
+        success = self.file_storage.save_chain(chain)
+        if success:
+            self.db_storage.index_chain_text(chain.id, chain.name, chain.description)
+        return success
+    
+    async def asave_chain(self, chain: ChainDefinition) -> bool:
+        """Save chain to file storage without blocking the event loop"""
+        success = await self.file_storage.asave_chain(chain)
+        if success:
+            await asyncio.to_thread(
+                self.db_storage.index_chain_text, chain.id, chain.name, chain.description
+            )
+        return success
+    
+    async def asave_chains(self, chains: List[ChainDefinition]) -> List[bool]:
+        """Save several chains concurrently"""
+        return list(await asyncio.gather(*(self.asave_chain(chain) for chain in chains)))
     
     def load_chain(self, chain_id: str) -> Optional[ChainDefinition]:
         """Load chain from file storage"""
@@ -503,13 +1413,21 @@ class ChainStorageManager:
         """List chains from file storage"""
         return self.file_storage.list_chains(**kwargs)
     
+    def list_chain_summaries(self, **kwargs) -> List[Dict[str, Any]]:
+        """List chain summaries from the metadata index"""
+        return self.file_storage.list_chain_summaries(**kwargs)
+    
     def delete_chain(self, chain_id: str) -> bool:
         """Delete chain from both storages"""
-        return self.file_storage.delete_chain(chain_id)
+        success = self.file_storage.delete_chain(chain_id)
+        if success:
+            self.db_storage.remove_chain_text(chain_id)
+        return success
     
-    def search_chains(self, **kwargs) -> List[Dict[str, Any]]:
-        """Search chains"""
-        return self.file_storage.search_chains(**kwargs)
+    def search_chains(self, query: str = "", tags: List[str] = None, limit: int = None) -> List[Dict[str, Any]]:
+        """Search chains, narrowing text queries to the full-text index's candidates first"""
+        chain_ids = self.db_storage.search_chain_ids(query) if query else None
+        return self.file_storage.search_chains(query=query, tags=tags, limit=limit, chain_ids=chain_ids)
     
     def save_execution_result(self, result: ChainExecutionResult) -> bool:
         """Save execution result to both storages"""
@@ -517,8 +1435,33 @@ class ChainStorageManager:
         db_success = self.db_storage.save_execution_to_db(result)
         return file_success  # File storage is primary
     
+    async def asave_execution_result(self, result: ChainExecutionResult) -> bool:
+        """Save execution result to both storages without blocking the event loop"""
+        file_success = await self.file_storage.asave_execution_result(result)
+        await asyncio.to_thread(self.db_storage.save_execution_to_db, result)
+        return file_success  # File storage is primary
+    
+    def save_executions_batch(self, results: List[ChainExecutionResult]) -> bool:
+        """Save many execution results, committing the database side once"""
+        file_success = all([self.file_storage.save_execution_result(result) for result in results])
+        self.db_storage.save_executions_batch(results)
+        return file_success  # File storage is primary
+    
+    async def asave_executions_batch(self, results: List[ChainExecutionResult]) -> bool:
+        """Save many execution results with concurrent file writes and one database commit"""
+        file_results = await asyncio.gather(
+            *(self.file_storage.asave_execution_result(result) for result in results)
+        )
+        await asyncio.to_thread(self.db_storage.save_executions_batch, results)
+        return all(file_results)  # File storage is primary
+    
     def get_execution_history(self, chain_id: str, limit: int = 50) -> List[ChainExecutionResult]:
-        """Get execution history"""
+        """Get execution history, preferring the indexed database lookup"""
+        history = self.db_storage.get_execution_history(chain_id, limit)
+        if history is not None and (history or self.db_storage.has_executions()):
+            return history
+        
+        # Database unavailable or not yet populated - scan the execution files
         return self.file_storage.get_execution_history(chain_id, limit)
     
     def get_chain_analytics(self, chain_id: str) -> Optional[ChainAnalytics]:
@@ -529,14 +1472,26 @@ class ChainStorageManager:
         """Get system analytics"""
         return self.db_storage.get_system_analytics()
     
+    def compact_executions(self, keep_months: int = _HOT_EXECUTION_MONTHS) -> int:
+        """Archive old executions out of the hot database table"""
+        return self.db_storage.compact_executions(keep_months)
+    
     def save_template(self, template: ChainTemplate) -> bool:
         """Save chain template"""
         return self.file_storage.save_template(template)
     
+    async def asave_template(self, template: ChainTemplate) -> bool:
+        """Save chain template without blocking the event loop"""
+        return await self.file_storage.asave_template(template)
+    
     def load_template(self, template_id: str) -> Optional[ChainTemplate]:
         """Load chain template"""
         return self.file_storage.load_template(template_id)
     
     def list_templates(self, **kwargs) -> List[ChainTemplate]:
         """List templates"""
-        return self.file_storage.list_templates(**kwargs) 
\ No newline at end of file
+        return self.file_storage.list_templates(**kwargs)
+    
+    def list_template_summaries(self, **kwargs) -> List[Dict[str, Any]]:
+        """List template summaries from the template index"""
+        return self.file_storage.list_template_summaries(**kwargs) 
\ No newline at end of file
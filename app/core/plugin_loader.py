@@ -1,15 +1,20 @@
 import os
-import json
+import pickle
 import importlib.util
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from ..models.plugin import PluginManifest
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+_MAX_DISCOVERY_WORKERS = 16
 
 
 class PluginLoader:
-    def __init__(self, plugins_dir: str = "app/plugins"):
+    def __init__(self, plugins_dir: str = "app/plugins", cache_file: str = "app/data/plugin_cache.pkl"):
         self.plugins_dir = Path(plugins_dir)
+        self.cache_file = Path(cache_file)
         self.loaded_plugins: Dict[str, Dict[str, Any]] = {}
         
     def discover_plugins(self) -> Dict[str, PluginManifest]:
@@ -18,24 +23,86 @@ class PluginLoader:
         
         if not self.plugins_dir.exists():
             return plugins
-            
-        for plugin_dir in self.plugins_dir.iterdir():
-            if plugin_dir.is_dir() and not plugin_dir.name.startswith('__'):
-                manifest_path = plugin_dir / "manifest.json"
-                if manifest_path.exists():
-                    try:
-                        plugin_manifest = self._load_manifest(manifest_path)
-                        plugins[plugin_manifest.id] = plugin_manifest
-                    except Exception as e:
-                        print(f"Error loading plugin {plugin_dir.name}: {e}")
+        
+        manifest_paths = [
+            plugin_dir / "manifest.json"
+            for plugin_dir in self.plugins_dir.iterdir()
+            if plugin_dir.is_dir() and not plugin_dir.name.startswith('__')
+            and (plugin_dir / "manifest.json").exists()
+        ]
+        if not manifest_paths:
+            return plugins
+        
+        cache = self._load_manifest_cache()
+        new_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        
+        # Manifests are small files, so reading them is I/O-latency bound; overlap the reads
+        with ThreadPoolExecutor(max_workers=min(_MAX_DISCOVERY_WORKERS, len(manifest_paths))) as executor:
+            for manifest_path, loaded in zip(manifest_paths, executor.map(
+                lambda path: self._try_load_manifest(path, cache), manifest_paths
+            )):
+                if loaded:
+                    plugin_manifest, cache_entry = loaded
+                    plugins[plugin_manifest.id] = plugin_manifest
+                    new_cache[str(manifest_path)] = cache_entry
+        
+        if new_cache != cache:
+            self._save_manifest_cache(new_cache)
                         
         return plugins
     
+    def discover_plugin(self, plugin_id: str) -> Optional[PluginManifest]:
+        """Load a single plugin's manifest, or None if it is missing or invalid"""
+        manifest_path = self.plugins_dir / plugin_id / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        loaded = self._try_load_manifest(manifest_path, {})
+        return loaded[0] if loaded else None
+    
+    def unload_plugin_module(self, plugin_id: str):
+        """Forget a plugin's imported modules so the next load picks up source changes"""
+        self.loaded_plugins.pop(plugin_id, None)
+        package_name = f"app.plugins.{plugin_id}"
+        for module_name in [name for name in sys.modules if name == package_name or name.startswith(package_name + ".")]:
+            del sys.modules[module_name]
+    
+    def _try_load_manifest(self, manifest_path: Path, cache: Dict[str, Any]) -> Optional[Tuple[PluginManifest, Tuple]]:
+        """Load a manifest, reusing the cached copy while the file's mtime and size are unchanged"""
+        try:
+            stat = manifest_path.stat()
+            cached = cache.get(str(manifest_path))
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return PluginManifest.model_validate(cached[2]), cached
+            
+            plugin_manifest = self._load_manifest(manifest_path)
+            return plugin_manifest, (stat.st_mtime_ns, stat.st_size, plugin_manifest.model_dump(by_alias=True))
+        except Exception as e:
+            print(f"Error loading plugin {manifest_path.parent.name}: {e}")
+            return None
+    
     def _load_manifest(self, manifest_path: Path) -> PluginManifest:
         """Load and validate plugin manifest"""
-        with open(manifest_path, 'r') as f:
-            manifest_data = json.load(f)
-        return PluginManifest(**manifest_data)
+        return PluginManifest.model_validate_json(manifest_path.read_bytes())
+    
+    def _load_manifest_cache(self) -> Dict[str, Tuple[int, int, Dict[str, Any]]]:
+        """Load the persisted manifest cache, treating any unreadable cache as empty"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cache = pickle.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except Exception:
+            return {}
+    
+    def _save_manifest_cache(self, cache: Dict[str, Tuple[int, int, Dict[str, Any]]]):
+        """Persist the manifest cache atomically"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Failed to save plugin manifest cache: {e}")
     
     def load_plugin_module(self, plugin_id: str) -> Optional[Any]:
         """Load the plugin module dynamically"""
@@ -1,24 +1,322 @@
+import os
 import time
-import shutil
-from typing import Dict, Any, Optional, List
-from pydantic import ValidationError
-from ..models.plugin import PluginManifest, PluginInput, PluginOutput, BasePlugin
-from ..models.response import PluginExecutionResponse
+import atexit
+import asyncio
+import threading
+import hashlib
+import functools
+from collections import OrderedDict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, List, Type
+import orjson
+from pydantic import BaseModel, ValidationError
+from ..models.plugin import PluginManifest, PluginInput, PluginOutput, BasePlugin, InputField, FileResult
+from ..models.plugin import DependencyStatus, DependencyDetail, ComplianceStatus
+from ..models.response import PluginExecutionResponse, PluginListResponse
 from .plugin_loader import PluginLoader
 
+try:
+    import watchfiles
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+
+# Healthy plugin statuses are reused across restarts for at most this long
+_STATUS_CACHE_TTL = 3600
+
+# Results of plugins whose manifest declares "pure": true, kept in LRU order
+_RESULT_CACHE_SIZE = 1024
+_UNRESOLVED = object()
+
+
+def _hash_data(data: Dict[str, Any]) -> bytes:
+    """Canonical digest of plugin input data"""
+    return hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _path_executables() -> frozenset:
+    """Names of the files on PATH, gathered with a single directory scan per PATH entry"""
+    pathext = set()
+    if os.name == "nt":
+        pathext = {ext.lower() for ext in os.environ.get("PATHEXT", "").split(os.pathsep) if ext}
+    
+    names = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        continue
+                    if pathext:
+                        # Windows resolves "pandoc" to "pandoc.exe" case-insensitively
+                        name = entry.name.lower()
+                        root, ext = os.path.splitext(name)
+                        if ext in pathext:
+                            names.add(root)
+                        names.add(name)
+                    else:
+                        names.add(entry.name)
+        except OSError:
+            continue
+    return frozenset(names)
+
+
+_CHECKBOX_TRUE = frozenset(('true', 'on', 'yes', '1'))
+
+
+def _compile_field_check(input_field: InputField) -> Optional[Callable[[Dict[str, Any]], Optional[str]]]:
+    """Specialise the validation of one input field into a closure (None when nothing to check)"""
+    field_name = input_field.name
+    missing_error = f"Required field '{field_name}' is missing" if input_field.required else None
+    value_check = None
+    
+    # Type validation based on field type
+    if input_field.field_type == "number":
+        error = f"Field '{field_name}' must be a number"
+        
+        def value_check(data, field_value):
+            try:
+                float(field_value)
+            except (ValueError, TypeError):
+                return error
+            return None
+    
+    elif input_field.field_type == "checkbox":
+        error = f"Field '{field_name}' must be a boolean"
+        
+        def value_check(data, field_value):
+            if isinstance(field_value, str):
+                data[field_name] = field_value.lower() in _CHECKBOX_TRUE
+            elif not isinstance(field_value, bool):
+                return error
+            return None
+    
+    elif input_field.field_type == "select" and input_field.options:
+        options = frozenset(input_field.options)
+        error = f"Field '{field_name}' must be one of: {', '.join(input_field.options)}"
+        
+        def value_check(data, field_value):
+            try:
+                if field_value in options:
+                    return None
+            except TypeError:
+                pass  # unhashable values can never be one of the options
+            return error
+    
+    elif input_field.field_type == "file" and input_field.validation:
+        allowed_extensions = input_field.validation.get("allowed_extensions")
+        if allowed_extensions:
+            if isinstance(allowed_extensions, str):
+                allowed_extensions = [allowed_extensions]
+            # Lowercased once here, so the check below is a single set probe
+            allowed = frozenset(extension.lower() for extension in allowed_extensions)
+            error = f"Invalid file type for '{field_name}'. Allowed types are: {', '.join(allowed_extensions)}"
+            
+            def value_check(data, field_value):
+                if isinstance(field_value, dict):
+                    file_ext = field_value.get("filename", "").rpartition(".")[2].lower()
+                    if file_ext not in allowed:
+                        return error
+                return None
+    
+    if missing_error is None and value_check is None:
+        return None
+    
+    def check(data):
+        if field_name not in data:
+            return missing_error
+        if value_check is not None:
+            return value_check(data, data[field_name])
+        return None
+    
+    return check
+
+
+def _compile_validator(manifest: PluginManifest) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """Compile a manifest's input fields into one function returning the first validation error"""
+    checks = [check for check in map(_compile_field_check, manifest.inputs) if check is not None]
+    
+    def validate(data: Dict[str, Any]) -> Optional[str]:
+        for check in checks:
+            error = check(data)
+            if error:
+                return error
+        return None
+    
+    return validate
+
+
+def _on_path(name: str) -> bool:
+    """Check whether an executable is available on PATH"""
+    return (name.lower() if os.name == "nt" else name) in _path_executables()
+
 
 class PluginManager:
-    def __init__(self):
+    def __init__(self, status_cache_file: str = "app/data/plugin_status_cache.json"):
         self.loader = PluginLoader()
+        self.status_cache_file = Path(status_cache_file)
         self.plugins: Dict[str, PluginManifest] = {}
+        # Listing views of self.plugins, rebuilt whenever it is swapped
+        self._plugin_list: List[PluginManifest] = []
+        self._plugins_json: Optional[bytes] = None
+        # Resolved at most once per refresh so execution never goes back through the loader
+        self._class_cache: Dict[str, Optional[Type[BasePlugin]]] = {}
+        self._response_models: Dict[str, Type[BaseModel]] = {}
+        self._validators: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {}
+        # Shared instances of stateless plugins, created on first execution
+        self._instances: Dict[str, BasePlugin] = {}
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._result_lock = threading.Lock()
+        self._refresh_lock = threading.RLock()
+        self._lazy_lock = threading.Lock()
+        # Plugins run here so blocking or CPU-bound work never runs on the event loop
+        self._exec_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="plugin-exec")
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
         self.refresh_plugins()
     
     def refresh_plugins(self):
         """Refresh the list of available plugins"""
-        self.plugins = self.loader.discover_plugins()
-        for plugin in self.plugins.values():
+        with self._refresh_lock:
+            # Statuses are computed on freshly discovered manifests and published in one swap,
+            # so concurrent executions see either the old or the new state, never a mix
+            plugins = self.loader.discover_plugins()
+            _path_executables.cache_clear()
+            self._check_plugin_statuses(plugins)
+            validators = {plugin_id: _compile_validator(plugin) for plugin_id, plugin in plugins.items()}
+            
+            (self.plugins, self._plugin_list, self._plugins_json, self._validators, self._non_compliant,
+             self._class_cache, self._response_models, self._instances) = (
+                plugins, list(plugins.values()), None, validators, None, {}, {}, {}
+            )
+            with self._result_lock:
+                self._result_cache.clear()
+    
+    def refresh_plugin(self, plugin_id: str):
+        """Re-discover a single plugin after its files changed, leaving the others untouched"""
+        with self._refresh_lock:
+            self.loader.unload_plugin_module(plugin_id)
+            manifest = self.loader.discover_plugin(plugin_id)
+            
+            plugins, validators = dict(self.plugins), dict(self._validators)
+            class_cache, response_models, instances = dict(self._class_cache), dict(self._response_models), dict(self._instances)
+            for state in (plugins, validators, class_cache, response_models, instances):
+                state.pop(plugin_id, None)
+            if manifest is not None:
+                self._check_plugin_statuses({plugin_id: manifest}, partial=True)
+                plugins[plugin_id] = manifest
+                validators[plugin_id] = _compile_validator(manifest)
+            
+            (self.plugins, self._plugin_list, self._plugins_json, self._validators, self._non_compliant,
+             self._class_cache, self._response_models, self._instances) = (
+                plugins, list(plugins.values()), None, validators, None, class_cache, response_models, instances
+            )
+            with self._result_lock:
+                self._result_cache.clear()
+    
+    def start_watching(self) -> bool:
+        """Refresh plugins as their files change; returns False when watchfiles is unavailable"""
+        if not WATCHFILES_AVAILABLE:
+            return False
+        if self._watch_thread is None:
+            self._watch_stop.clear()
+            self._watch_thread = threading.Thread(target=self._watch_plugins, name="plugin-watch", daemon=True)
+            self._watch_thread.start()
+            # Killing the watcher mid-poll at interpreter exit aborts the process
+            atexit.register(self.stop_watching)
+        return True
+    
+    def stop_watching(self):
+        """Stop the plugin directory watcher"""
+        if self._watch_thread is not None:
+            self._watch_stop.set()
+            self._watch_thread.join()
+            self._watch_thread = None
+    
+    def _watch_plugins(self):
+        """Block on filesystem events for the plugin directory and refresh only the plugins touched"""
+        plugins_dir = self.loader.plugins_dir.resolve()
+        try:
+            # Debounced by watchfiles, so an editor's burst of writes becomes one batch
+            for changes in watchfiles.watch(
+                plugins_dir,
+                watch_filter=watchfiles.PythonFilter(extra_extensions=(".json",)),
+                stop_event=self._watch_stop,
+                raise_interrupt=False
+            ):
+                plugin_ids = set()
+                for _, path in changes:
+                    try:
+                        parts = Path(path).relative_to(plugins_dir).parts
+                    except ValueError:
+                        continue
+                    if len(parts) > 1 and not parts[0].startswith('__'):
+                        plugin_ids.add(parts[0])
+                for plugin_id in plugin_ids:
+                    self.refresh_plugin(plugin_id)
+        except Exception as e:
+            print(f"Plugin watcher stopped: {e}")
+    
+    def _check_plugin_statuses(self, plugins: Dict[str, PluginManifest], partial: bool = False):
+        """Set dependency status on each manifest, reusing cached healthy results"""
+        cache = self._load_status_cache()
+        # A partial check keeps the cached entries of the plugins it was not given
+        new_cache = {plugin_id: entry for plugin_id, entry in cache.items() if plugin_id not in plugins} if partial else {}
+        now = time.time()
+        for plugin in plugins.values():
+            fingerprint = self._plugin_fingerprint(plugin.id)
+            entry = cache.get(plugin.id)
+            if entry and entry["fingerprint"] == fingerprint and now - entry["checked_at"] < _STATUS_CACHE_TTL:
+                # Unchanged since a healthy check: skip importing the plugin and probing its dependencies
+                plugin.dependency_status = DependencyStatus.from_dict(entry["dependency_status"])
+                new_cache[plugin.id] = entry
+                continue
+            
+            # Compliance needs the plugin class, so it is checked on first use instead (see get_compliance_status)
             self._check_dependencies(plugin)
-            self._validate_plugin_compliance(plugin)
+            
+            # Failures are re-checked on every start, when they are most likely being fixed
+            if plugin.dependency_status.all_met:
+                new_cache[plugin.id] = {
+                    "fingerprint": fingerprint,
+                    "checked_at": now,
+                    "dependency_status": plugin.dependency_status
+                }
+        
+        if new_cache != cache:
+            self._save_status_cache(new_cache)
+    
+    def _plugin_fingerprint(self, plugin_id: str) -> str:
+        """Hash of the plugin's source files (path, mtime, size) and the PATH they resolve against"""
+        digest = hashlib.sha1(os.environ.get("PATH", "").encode())
+        plugin_dir = self.loader.plugins_dir / plugin_id
+        for root, dirs, files in os.walk(plugin_dir):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                if name.endswith((".py", ".json")):
+                    stat = os.stat(os.path.join(root, name))
+                    digest.update(f"{os.path.join(root, name)}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return digest.hexdigest()
+    
+    def _load_status_cache(self) -> Dict[str, Any]:
+        """Load persisted plugin statuses, treating any unreadable cache as empty"""
+        try:
+            return orjson.loads(self.status_cache_file.read_bytes())
+        except Exception:
+            return {}
+    
+    def _save_status_cache(self, cache: Dict[str, Any]):
+        """Persist plugin statuses atomically"""
+        try:
+            self.status_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.status_cache_file.with_name(f"{self.status_cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(orjson.dumps(cache))
+            os.replace(tmp_file, self.status_cache_file)
+        except Exception as e:
+            print(f"Failed to save plugin status cache: {e}")
     
     def _validate_plugin_compliance(self, plugin: PluginManifest):
         """
@@ -26,68 +324,68 @@ class PluginManager:
         must define Pydantic response models.
         """
         try:
-            plugin_class = self.loader.get_plugin_class(plugin.id)
+            plugin_class = self.get_plugin_class(plugin.id)
             if not plugin_class:
-                plugin.compliance_status = {
-                    "compliant": False,
-                    "error": f"Could not load plugin class for '{plugin.id}'"
-                }
+                plugin.compliance_status = ComplianceStatus(
+                    compliant=False,
+                    error=f"Could not load plugin class for '{plugin.id}'"
+                )
                 return
             
             # Check if plugin inherits from BasePlugin
             if not issubclass(plugin_class, BasePlugin):
-                plugin.compliance_status = {
-                    "compliant": False,
-                    "error": f"Plugin '{plugin.id}' must inherit from BasePlugin"
-                }
+                plugin.compliance_status = ComplianceStatus(
+                    compliant=False,
+                    error=f"Plugin '{plugin.id}' must inherit from BasePlugin"
+                )
                 return
             
             # Check if plugin implements get_response_model method
             if not hasattr(plugin_class, 'get_response_model'):
-                plugin.compliance_status = {
-                    "compliant": False,
-                    "error": f"Plugin '{plugin.id}' must implement get_response_model() method"
-                }
+                plugin.compliance_status = ComplianceStatus(
+                    compliant=False,
+                    error=f"Plugin '{plugin.id}' must implement get_response_model() method"
+                )
                 return
             
             # Try to get the response model
             try:
                 response_model = plugin_class.get_response_model()
                 if not response_model:
-                    plugin.compliance_status = {
-                        "compliant": False,
-                        "error": f"Plugin '{plugin.id}' get_response_model() returned None"
-                    }
+                    plugin.compliance_status = ComplianceStatus(
+                        compliant=False,
+                        error=f"Plugin '{plugin.id}' get_response_model() returned None"
+                    )
                     return
                 
                 # Verify it's a Pydantic model
                 if not hasattr(response_model, '__fields__'):
-                    plugin.compliance_status = {
-                        "compliant": False,
-                        "error": f"Plugin '{plugin.id}' response model must be a Pydantic BaseModel"
-                    }
+                    plugin.compliance_status = ComplianceStatus(
+                        compliant=False,
+                        error=f"Plugin '{plugin.id}' response model must be a Pydantic BaseModel"
+                    )
                     return
                 
-                plugin.compliance_status = {
-                    "compliant": True,
-                    "response_model": response_model.__name__
-                }
+                plugin.compliance_status = ComplianceStatus(
+                    compliant=True,
+                    response_model=response_model.__name__
+                )
                 
             except Exception as e:
-                plugin.compliance_status = {
-                    "compliant": False,
-                    "error": f"Plugin '{plugin.id}' get_response_model() failed: {str(e)}"
-                }
+                plugin.compliance_status = ComplianceStatus(
+                    compliant=False,
+                    error=f"Plugin '{plugin.id}' get_response_model() failed: {str(e)}"
+                )
                 
         except Exception as e:
-            plugin.compliance_status = {
-                "compliant": False,
-                "error": f"Plugin '{plugin.id}' compliance check failed: {str(e)}"
-            }
+            plugin.compliance_status = ComplianceStatus(
+                compliant=False,
+                error=f"Plugin '{plugin.id}' compliance check failed: {str(e)}"
+            )
     
     def _check_dependencies(self, plugin: PluginManifest):
         """Check plugin dependencies and update its status"""
-        plugin.dependency_status = {"all_met": True, "details": []}
+        plugin.dependency_status = DependencyStatus()
 
         if not plugin.dependencies:
             return
@@ -99,11 +397,11 @@ class PluginManager:
                 
                 # Fall back to standard PATH check if no custom check available
                 if is_met is None:
-                    is_met = shutil.which(dep.name) is not None
+                    is_met = _on_path(dep.name)
                 
                 if not is_met:
-                    plugin.dependency_status["all_met"] = False
-                plugin.dependency_status["details"].append({"name": dep.name, "met": is_met})
+                    plugin.dependency_status.all_met = False
+                plugin.dependency_status.details.append(DependencyDetail(dep.name, is_met))
     
     def _check_custom_dependency(self, plugin_id: str, dependency_name: str) -> Optional[bool]:
         """Check if plugin has custom dependency checking logic"""
@@ -132,161 +430,224 @@ class PluginManager:
         return None
     
     def get_all_plugins(self) -> List[PluginManifest]:
-        """Get all available plugins"""
-        return list(self.plugins.values())
+        """Get all available plugins (a shared list; callers must not modify it)"""
+        return self._plugin_list
+    
+    def get_plugins_json(self) -> bytes:
+        """Get the plugin list response as JSON, serialized once until plugins or their statuses change"""
+        plugins_json = self._plugins_json
+        if plugins_json is None:
+            plugin_list = self._plugin_list
+            # The listing reports every plugin's compliance, so check any not used yet
+            for plugin in plugin_list:
+                self.get_compliance_status(plugin)
+            # Aliased like FastAPI's response_model serialization ("help", "schema")
+            plugins_json = PluginListResponse(success=True, plugins=plugin_list).model_dump_json(by_alias=True).encode()
+            if self._plugin_list is plugin_list:
+                self._plugins_json = plugins_json
+        return plugins_json
     
     def get_plugin(self, plugin_id: str) -> Optional[PluginManifest]:
         """Get a specific plugin by ID"""
         return self.plugins.get(plugin_id)
     
+    def get_plugin_class(self, plugin_id: str) -> Optional[Type[BasePlugin]]:
+        """Get a plugin class, importing it on first use after a refresh"""
+        class_cache = self._class_cache
+        # Failed imports are cached as None, so a sentinel marks "not resolved yet"
+        plugin_class = class_cache.get(plugin_id, _UNRESOLVED)
+        if plugin_class is _UNRESOLVED:
+            if plugin_id not in self.plugins:
+                return None
+            with self._lazy_lock:
+                plugin_class = class_cache.get(plugin_id, _UNRESOLVED)
+                if plugin_class is _UNRESOLVED:
+                    plugin_class = class_cache[plugin_id] = self.loader.get_plugin_class(plugin_id)
+        return plugin_class
+    
+    def get_compliance_status(self, plugin: PluginManifest) -> ComplianceStatus:
+        """Get a plugin's compliance status, importing and checking the plugin on first use"""
+        if plugin.compliance_status is None:
+            # Checks are idempotent, so concurrent first uses may both run them harmlessly
+            self._validate_plugin_compliance(plugin)
+            # The serialized plugin list embeds compliance statuses
+            self._plugins_json = None
+        return plugin.compliance_status
+    
     def get_non_compliant_plugins(self) -> List[Dict[str, Any]]:
         """Get list of plugins that don't comply with the response model rule"""
-        non_compliant = []
-        for plugin in self.plugins.values():
-            if hasattr(plugin, 'compliance_status') and not plugin.compliance_status.get("compliant", False):
-                non_compliant.append({
-                    "plugin_id": plugin.id,
-                    "plugin_name": plugin.name,
-                    "error": plugin.compliance_status.get("error", "Unknown compliance error")
-                })
-        return non_compliant
+        non_compliant = self._non_compliant
+        if non_compliant is None:
+            # Built once per refresh, checking every plugin that hasn't been used yet
+            non_compliant = []
+            for plugin in self.plugins.values():
+                status = self.get_compliance_status(plugin)
+                if not status.compliant:
+                    non_compliant.append({
+                        "plugin_id": plugin.id,
+                        "plugin_name": plugin.name,
+                        "error": status.error or "Unknown compliance error"
+                    })
+            self._non_compliant = non_compliant
+        # Copied so callers can't mutate the shared list
+        return list(non_compliant)
     
     def execute_plugin(self, plugin_input: PluginInput) -> PluginExecutionResponse:
         """Execute a plugin with the given input"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        plugin_id = plugin_input.plugin_id
         
         try:
-            # Check if plugin exists
-            if plugin_input.plugin_id not in self.plugins:
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error=f"Plugin '{plugin_input.plugin_id}' not found"
-                )
-            
             # Get plugin manifest
-            manifest = self.plugins[plugin_input.plugin_id]
+            manifest = self.plugins.get(plugin_id)
+            if manifest is None:
+                return self._build_error(plugin_id, f"Plugin '{plugin_id}' not found")
             
             # Check plugin compliance
-            if hasattr(manifest, 'compliance_status') and not manifest.compliance_status.get("compliant", False):
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error=f"Plugin '{plugin_input.plugin_id}' is not compliant: {manifest.compliance_status.get('error', 'Unknown error')}"
+            compliance_status = manifest.compliance_status or self.get_compliance_status(manifest)
+            if not compliance_status.compliant:
+                return self._build_error(
+                    plugin_id,
+                    f"Plugin '{plugin_id}' is not compliant: {compliance_status.error or 'Unknown error'}"
                 )
             
             # Load plugin class
-            plugin_class = self.loader.get_plugin_class(plugin_input.plugin_id)
+            plugin_class = self.get_plugin_class(plugin_id)
             if not plugin_class:
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error=f"Could not load plugin class for '{plugin_input.plugin_id}'"
-                )
+                return self._build_error(plugin_id, f"Could not load plugin class for '{plugin_id}'")
 
             # Check if dependencies are met before execution
-            if hasattr(manifest, 'dependency_status') and not manifest.dependency_status["all_met"]:
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error="Cannot execute plugin due to unmet dependencies."
-                )
+            if not manifest.dependency_status.all_met:
+                return self._build_error(plugin_id, "Cannot execute plugin due to unmet dependencies.")
 
             validation_error = self._validate_input(plugin_input.data, manifest)
             if validation_error:
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error=validation_error
-                )
+                return self._build_error(plugin_id, validation_error)
+            
+            # Identical input to a pure plugin: skip execution and response validation
+            cache_key = self._result_cache_key(manifest, plugin_input.data)
+            if cache_key is not None:
+                with self._result_lock:
+                    cached = self._result_cache.get(cache_key)
+                    if cached is not None:
+                        self._result_cache.move_to_end(cache_key)
+                if cached is not None:
+                    return PluginExecutionResponse.model_construct(
+                        success=True,
+                        plugin_id=plugin_id,
+                        data=cached,
+                        execution_time=(time.perf_counter_ns() - start_ns) / 1e9
+                    )
             
             # Execute plugin
-            plugin_instance = plugin_class()
+            plugin_instance = self._get_plugin_instance(manifest, plugin_class)
             result = plugin_instance.execute(plugin_input.data)
             
             # Validate response against plugin's response model
             try:
-                validated_response = plugin_instance.validate_response(result)
+                validated_response = self._validate_response(manifest, plugin_instance, result)
                 # Convert back to dict for consistent API
-                result = validated_response.dict()
-            except ValidationError as e:
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error=f"Plugin response validation failed: {str(e)}"
+                result = validated_response.model_dump()
+                # Plugins that predate FileResult still mark downloads with file_path/file_name keys
+                is_file_result = isinstance(validated_response, FileResult) or (
+                    "file_path" in result and "file_name" in result
                 )
+            except ValidationError as e:
+                return self._build_error(plugin_id, f"Plugin response validation failed: {str(e)}")
             except Exception as e:
-                return PluginExecutionResponse(
-                    success=False,
-                    plugin_id=plugin_input.plugin_id,
-                    error=f"Plugin response validation error: {str(e)}"
-                )
+                return self._build_error(plugin_id, f"Plugin response validation error: {str(e)}")
             
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
-            # Check if the result contains file data
-            if "file_path" in result and "file_name" in result:
-                return PluginExecutionResponse(
+            # Responses are built from the already validated result, so they skip validation
+            if is_file_result:
+                return PluginExecutionResponse.model_construct(
                     success=True,
-                    plugin_id=plugin_input.plugin_id,
+                    plugin_id=plugin_id,
                     file_data=result,
                     execution_time=execution_time
                 )
 
-            return PluginExecutionResponse(
+            if cache_key is not None:
+                with self._result_lock:
+                    self._result_cache[cache_key] = result
+                    if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+
+            return PluginExecutionResponse.model_construct(
                 success=True,
-                plugin_id=plugin_input.plugin_id,
+                plugin_id=plugin_id,
                 data=result,
                 execution_time=execution_time
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            return PluginExecutionResponse(
-                success=False,
-                plugin_id=plugin_input.plugin_id,
-                error=str(e),
-                execution_time=execution_time
-            )
+            return self._build_error(plugin_id, str(e), start_ns)
+    
+    @staticmethod
+    def _result_cache_key(manifest: PluginManifest, data: Dict[str, Any]) -> Optional[tuple]:
+        """Memoization key for pure plugins; None when the result must not be cached"""
+        if not manifest.pure:
+            return None
+        try:
+            return (manifest.id, _hash_data(data))
+        except TypeError:
+            return None  # input is not JSON-serializable
+    
+    def _get_plugin_instance(self, manifest: PluginManifest, plugin_class: Type[BasePlugin]) -> BasePlugin:
+        """Reuse one instance per plugin unless its manifest declares it stateful"""
+        if manifest.stateful:
+            return plugin_class()
+        
+        instances = self._instances
+        instance = instances.get(manifest.id)
+        if instance is None:
+            with self._lazy_lock:
+                instance = instances.get(manifest.id)
+                if instance is None:
+                    instance = instances[manifest.id] = plugin_class()
+        return instance
+    
+    async def execute_plugin_async(self, plugin_input: PluginInput) -> PluginExecutionResponse:
+        """Execute a plugin on the worker pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._exec_pool, self.execute_plugin, plugin_input)
+    
+    def execute_many(self, plugin_inputs: List[PluginInput]) -> List[PluginExecutionResponse]:
+        """Execute several plugin inputs concurrently, returning results in input order"""
+        return list(self._exec_pool.map(self.execute_plugin, plugin_inputs))
+    
+    @staticmethod
+    def _build_error(plugin_id: str, error: str, start_ns: Optional[int] = None) -> PluginExecutionResponse:
+        """Failed execution response, timed only when the plugin itself raised"""
+        return PluginExecutionResponse.model_construct(
+            success=False,
+            plugin_id=plugin_id,
+            error=error,
+            execution_time=None if start_ns is None else (time.perf_counter_ns() - start_ns) / 1e9
+        )
+    
+    def _validate_response(self, manifest: PluginManifest, plugin_instance: BasePlugin, result: Any) -> BaseModel:
+        """Validate a plugin result, reusing the plugin's response model across calls"""
+        response_model = self._response_models.get(manifest.id)
+        if response_model is None:
+            response_model = self._response_models[manifest.id] = plugin_instance.get_response_model()
+        
+        # A plugin that already built its response model has nothing left to validate
+        if isinstance(result, response_model):
+            return result
+        
+        if type(plugin_instance).validate_response is not BasePlugin.validate_response:
+            return plugin_instance.validate_response(result)
+        
+        # Plugins whose manifest declares "trusted": true skip re-validating their own dicts
+        if manifest.trusted:
+            return response_model.model_construct(**result)
+        return response_model.model_validate(result)
     
     def _validate_input(self, data: Dict[str, Any], manifest: PluginManifest) -> Optional[str]:
         """Validate input data against plugin manifest"""
-        for input_field in manifest.inputs:
-            field_name = input_field.name
-            
-            # Check required fields
-            if input_field.required and field_name not in data:
-                return f"Required field '{field_name}' is missing"
-            
-            # Skip validation for optional missing fields
-            if field_name not in data:
-                continue
-            
-            field_value = data[field_name]
-            
-            # Type validation based on field type
-            if input_field.field_type == "number":
-                try:
-                    float(field_value)
-                except (ValueError, TypeError):
-                    return f"Field '{field_name}' must be a number"
-            
-            elif input_field.field_type == "checkbox":
-                if isinstance(field_value, str):
-                    data[field_name] = field_value.lower() in ('true', 'on', 'yes', '1')
-                elif not isinstance(field_value, bool):
-                    return f"Field '{field_name}' must be a boolean"
-            
-            elif input_field.field_type == "select":
-                if input_field.options and field_value not in input_field.options:
-                    return f"Field '{field_name}' must be one of: {', '.join(input_field.options)}"
-            
-            elif input_field.field_type == "file" and input_field.validation:
-                allowed_extensions = input_field.validation.get("allowed_extensions")
-                if allowed_extensions and isinstance(field_value, dict):
-                    filename = field_value.get("filename", "")
-                    file_ext = filename.split(".")[-1].lower()
-                    if file_ext not in allowed_extensions:
-                        return f"Invalid file type for '{field_name}'. Allowed types are: {', '.join(allowed_extensions)}"
-
-        return None 
\ No newline at end of file
+        validator = self._validators.get(manifest.id)
+        if validator is None:
+            validator = self._validators[manifest.id] = _compile_validator(manifest)
+        return validator(data)
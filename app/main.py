@@ -1,53 +1,184 @@
-from fastapi import FastAPI, Request, Form, HTTPException, File, UploadFile
+from fastapi import FastAPI, APIRouter, Request, HTTPException, UploadFile
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
-from typing import Dict, Any
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
+from jinja2 import FileSystemBytecodeCache
+from typing import Dict, Any, Optional, Tuple
 import os
-import json
+import gzip
+import hashlib
 import time
 import uuid
 import tempfile
-import aiofiles
+import shutil
+import orjson
 from pathlib import Path
+from pydantic import BaseModel
 
 from .core.plugin_manager import PluginManager
 from .core.chain_manager import ChainManager
 from .models.plugin import PluginInput
 from .models.response import PluginListResponse, PluginExecutionResponse
-from .models.chain import ChainDefinition, ChainExecutionResult
+from .models.chain import ChainDefinition
+
+
+def _orjson_default(value: Any) -> Any:
+    """Embed Pydantic models as their own JSON, skipping the intermediate dict"""
+    if isinstance(value, BaseModel):
+        return orjson.Fragment(value.model_dump_json())
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, tolerating non-string keys and numpy values in plugin output"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+# Shared 404 responses, returned as-is instead of raising HTTPException on every miss
+PLUGIN_NOT_FOUND = ORJSONResponse({"detail": "Plugin not found"}, status_code=404)
+CHAIN_NOT_FOUND = ORJSONResponse({"detail": "Chain not found"}, status_code=404)
+TEMPLATE_NOT_FOUND = ORJSONResponse({"detail": "Template not found"}, status_code=404)
 
 # Initialize FastAPI app
 app = FastAPI(
     title=" Plugin System with Chain Builder",
     description="A FastAPI + Pydantic web application with dynamic plugin system and visual chain builder",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize managers
 plugin_manager = PluginManager()
+plugin_manager.start_watching()
 chain_manager = ChainManager(plugin_manager)
 
 # Setup templates and static files
 templates = Jinja2Templates(directory="app/templates")
+# Compiled templates are shared across workers and restarts; sources are only re-checked in development
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = os.environ.get("FASTAPI_ENV") == "development"
 
 # Add custom Jinja2 filters
+def _pretty_default(value: Any) -> Any:
+    """Dump Pydantic models to dicts so they are indented along with the rest of the value"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
 def tojsonpretty(value):
-    return json.dumps(value, indent=2, ensure_ascii=False)
+    return orjson.dumps(
+        value,
+        default=_pretty_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 templates.env.filters['tojsonpretty'] = tojsonpretty
 
+# Page templates are resolved once here instead of through the loader on every request
+_PAGE_TEMPLATES = {
+    name: templates.get_template(name)
+    for name in ("index.html", "how-to.html", "plugin.html", "result.html", "chain_builder.html", "chains.html")
+}
+
+
+def _render_page(name: str, context: Dict[str, Any]) -> HTMLResponse:
+    """Render a page template, re-resolving it only when templates auto-reload"""
+    template = templates.get_template(name) if templates.env.auto_reload else _PAGE_TEMPLATES[name]
+    return HTMLResponse(template.render(context))
+
+
+def _with_etag(request: Request, response: Response) -> Response:
+    """Tag a response with an ETag of its body, answering 304 when the client already has that body"""
+    etag = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+_STATIC_PAGE_CACHE: Dict[tuple, tuple] = {}
+_STATIC_PAGE_CACHE_SIZE = 32
+
+
+def _render_static_page(name: str, request: Request) -> HTMLResponse:
+    """Serve a page that only depends on the base URL, rendered and gzipped once per base URL"""
+    if templates.env.auto_reload:
+        return _render_page(name, {"request": request})
+    
+    # url_for renders absolute URLs, so the page is cached per base URL (bounded: it comes from the Host header)
+    key = (name, str(request.base_url))
+    cached = _STATIC_PAGE_CACHE.get(key)
+    if cached is None:
+        if len(_STATIC_PAGE_CACHE) >= _STATIC_PAGE_CACHE_SIZE:
+            _STATIC_PAGE_CACHE.clear()
+        html = _PAGE_TEMPLATES[name].render({"request": request}).encode()
+        cached = _STATIC_PAGE_CACHE[key] = (html, gzip.compress(html))
+    
+    html, html_gz = cached
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(html_gz, headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+    return HTMLResponse(html, headers={"Vary": "Accept-Encoding"})
+
+
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 
+_UPLOAD_COPY_BLOCK = 1 << 20
+
+
+def _copy_upload(source, temp_file_path: str):
+    """Copy a spooled upload to disk in large blocks"""
+    source.seek(0)
+    with open(temp_file_path, 'wb') as temp_file:
+        shutil.copyfileobj(source, temp_file, _UPLOAD_COPY_BLOCK)
+
+
+def _remove_file(path: str):
+    """Delete a temporary file, ignoring one that is already gone"""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _remove_upload(data: Dict[str, Any]):
+    """Delete the temporary copy of an uploaded input file, if any (plugins may have moved it)"""
+    file_info = data.get("input_file")
+    if isinstance(file_info, dict) and "temp_path" in file_info:
+        _remove_file(file_info["temp_path"])
+
+
+def _file_download(file_data: Dict[str, Any]) -> FileResponse:
+    """Serve a plugin's output file, deleting it once the response has been sent"""
+    file_path = file_data["file_path"]
+    # Stat once here so FileResponse doesn't stat again before sending
+    return FileResponse(
+        path=file_path,
+        filename=file_data["file_name"],
+        media_type="application/octet-stream",
+        stat_result=os.stat(file_path),
+        background=BackgroundTask(_remove_file, file_path)
+    )
+
+
 async def _stream_upload_to_temp(upload_file: UploadFile) -> str:
     """Stream uploaded file to temporary location without loading into memory"""
     temp_file_path = os.path.join(tempfile.gettempdir(), f"{uuid.uuid4()}_{upload_file.filename}")
     
     try:
-        async with aiofiles.open(temp_file_path, 'wb') as temp_file:
-            while chunk := await upload_file.read(8192):  # 8KB chunks
-                await temp_file.write(chunk)
+        # The upload is already spooled by Starlette; copy it in 1MB blocks off the event loop
+        await run_in_threadpool(_copy_upload, upload_file.file, temp_file_path)
         return temp_file_path
     except Exception as e:
         # Clean up partial file if error occurs
@@ -79,16 +210,20 @@ def cleanup_downloads_directory(max_age_hours: int = 24):
         return {"cleaned": 0, "error": str(e)}
 
 
+# Read once at startup; browsers may keep it for a week
+_FAVICON = Path("app/static/favicon.ico").read_bytes()
+
+
 @app.get('/favicon.ico', include_in_schema=False)
 async def favicon():
-    return FileResponse("app/static/favicon.ico")
+    return Response(_FAVICON, media_type="image/x-icon", headers={"Cache-Control": "public, max-age=604800"})
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Homepage showing available plugins"""
     plugins = plugin_manager.get_all_plugins()
-    return templates.TemplateResponse("index.html", {
+    return _render_page("index.html", {
         "request": request,
         "plugins": plugins
     })
@@ -97,14 +232,13 @@ async def home(request: Request):
 @app.get("/how-to", response_class=HTMLResponse)
 async def how_to_page(request: Request):
     """How-to page for building and testing plugins"""
-    return templates.TemplateResponse("how-to.html", {"request": request})
+    return _render_static_page("how-to.html", request)
 
 
 @app.get("/api/plugins", response_model=PluginListResponse)
-async def get_plugins():
+async def get_plugins(request: Request):
     """API endpoint to get all available plugins"""
-    plugins = plugin_manager.get_all_plugins()
-    return PluginListResponse(success=True, plugins=plugins)
+    return _with_etag(request, Response(content=plugin_manager.get_plugins_json(), media_type="application/json"))
 
 
 @app.get("/plugin/{plugin_id}", response_class=HTMLResponse)
@@ -112,21 +246,22 @@ async def plugin_page(request: Request, plugin_id: str):
     """Plugin interaction page"""
     plugin = plugin_manager.get_plugin(plugin_id)
     if not plugin:
-        raise HTTPException(status_code=404, detail="Plugin not found")
+        return PLUGIN_NOT_FOUND
     
-    return templates.TemplateResponse("plugin.html", {
+    return _render_page("plugin.html", {
         "request": request,
         "plugin": plugin
     })
 
 
-@app.post("/api/plugin/{plugin_id}/execute")
-async def execute_plugin_api(plugin_id: str, request: Request, input_file: UploadFile = File(None)):
-    """API endpoint to execute a plugin"""
+async def _run_plugin(plugin_id: str, request: Request) -> Tuple[PluginExecutionResponse, Dict[str, Any]]:
+    """Execute a plugin with the submitted form, returning the result and the input data it ran on"""
+    # Parsed once here; the upload is taken from the same form instead of a File() parameter.
+    # Plugins get a plain dict copy because validation coerces values in place
+    data = dict(await request.form())
+    input_file = data.pop("input_file", None)
+    
     try:
-        form_data = await request.form()
-        data = dict(form_data)
-        
         if input_file:
             # Stream large files to temporary location instead of loading into memory
             temp_file_path = await _stream_upload_to_temp(input_file)
@@ -137,18 +272,27 @@ async def execute_plugin_api(plugin_id: str, request: Request, input_file: Uploa
             }
 
         plugin_input = PluginInput(plugin_id=plugin_id, data=data)
-        result = plugin_manager.execute_plugin(plugin_input)
+        return await plugin_manager.execute_plugin_async(plugin_input), data
+    finally:
+        # The plugin has finished with its input by now, whatever the outcome
+        _remove_upload(data)
+
+
+@app.post("/api/plugin/{plugin_id}/execute")
+async def execute_plugin_api(plugin_id: str, request: Request):
+    """API endpoint to execute a plugin"""
+    try:
+        result, data = await _run_plugin(plugin_id, request)
 
         if result.success and result.file_data:
-            return FileResponse(
-                path=result.file_data["file_path"],
-                filename=result.file_data["file_name"],
-                media_type="application/octet-stream"
-            )
-        elif not result.success:
-             return JSONResponse(status_code=400, content=result.dict())
+            return _file_download(result.file_data)
 
-        return result
+        # Serialize straight to JSON bytes, skipping the jsonable_encoder pass
+        return Response(
+            content=result.model_dump_json(),
+            status_code=200 if result.success else 400,
+            media_type="application/json"
+        )
 
     except Exception as e:
         return PluginExecutionResponse(
@@ -159,37 +303,20 @@ async def execute_plugin_api(plugin_id: str, request: Request, input_file: Uploa
 
 
 @app.post("/plugin/{plugin_id}/execute", response_class=HTMLResponse)
-async def execute_plugin_web(request: Request, plugin_id: str, input_file: UploadFile = File(None)):
+async def execute_plugin_web(request: Request, plugin_id: str):
     """Web interface for plugin execution"""
     try:
-        form_data = await request.form()
-        data = dict(form_data)
-        
-        if input_file:
-            # Stream large files to temporary location instead of loading into memory
-            temp_file_path = await _stream_upload_to_temp(input_file)
-            data["input_file"] = {
-                "filename": input_file.filename,
-                "temp_path": temp_file_path,
-                "size": os.path.getsize(temp_file_path)
-            }
-
-        plugin_input = PluginInput(plugin_id=plugin_id, data=data)
-        result = plugin_manager.execute_plugin(plugin_input)
+        result, data = await _run_plugin(plugin_id, request)
 
         if result.success and result.file_data:
             # Clean up old downloads before serving new file
-            cleanup_downloads_directory(max_age_hours=1)  # Clean files older than 1 hour
+            await run_in_threadpool(cleanup_downloads_directory, max_age_hours=1)  # Clean files older than 1 hour
             
-            return FileResponse(
-                path=result.file_data["file_path"],
-                filename=result.file_data["file_name"],
-                media_type="application/octet-stream"
-            )
+            return _file_download(result.file_data)
 
         plugin = plugin_manager.get_plugin(plugin_id)
         
-        return templates.TemplateResponse("result.html", {
+        return _render_page("result.html", {
             "request": request,
             "plugin": plugin,
             "result": result,
@@ -203,7 +330,7 @@ async def execute_plugin_web(request: Request, plugin_id: str, input_file: Uploa
             error=str(e)
         )
         
-        return templates.TemplateResponse("result.html", {
+        return _render_page("result.html", {
             "request": request,
             "plugin": plugin,
             "result": error_result,
@@ -212,17 +339,21 @@ async def execute_plugin_web(request: Request, plugin_id: str, input_file: Uploa
 
 
 @app.get("/api/plugin/{plugin_id}")
-async def get_plugin_info(plugin_id: str):
+async def get_plugin_info(request: Request, plugin_id: str):
     """Get information about a specific plugin"""
     plugin = plugin_manager.get_plugin(plugin_id)
     if not plugin:
-        raise HTTPException(status_code=404, detail="Plugin not found")
+        return PLUGIN_NOT_FOUND
     
-    return {"success": True, "plugin": plugin}
+    # Aliased like the default encoder ("help", "schema")
+    return _with_etag(request, ORJSONResponse({
+        "success": True,
+        "plugin": orjson.Fragment(plugin.model_dump_json(by_alias=True))
+    }))
 
 
 @app.post("/api/refresh-plugins")
-async def refresh_plugins():
+def refresh_plugins():
     """Refresh the plugin list"""
     plugin_manager.refresh_plugins()
     plugins = plugin_manager.get_all_plugins()
@@ -230,33 +361,43 @@ async def refresh_plugins():
 
 
 @app.post("/api/cleanup-downloads")
-async def cleanup_downloads(max_age_hours: int = 24):
+def cleanup_downloads(max_age_hours: int = 24):
     """Clean up old files from downloads directory"""
     result = cleanup_downloads_directory(max_age_hours)
     return {"success": True, "cleanup_result": result}
 
 
+# Serialized compliance report and the plugin list it was built from; every refresh swaps
+# in a new list, so an identity check is enough to tell when it must be rebuilt
+_compliance_cache: Optional[Tuple[list, bytes]] = None
+
+
 @app.get("/api/plugin-compliance")
-async def check_plugin_compliance():
+def check_plugin_compliance():
     """
     Check plugin compliance with the rule: ALL PLUGINS MUST DEFINE PYDANTIC RESPONSE MODELS
     
     Returns information about which plugins are compliant and which need to be updated.
     """
+    global _compliance_cache
     all_plugins = plugin_manager.get_all_plugins()
+    cached = _compliance_cache
+    if cached is not None and cached[0] is all_plugins:
+        return Response(content=cached[1], media_type="application/json")
+    
     non_compliant = plugin_manager.get_non_compliant_plugins()
     
     compliant_plugins = []
     for plugin in all_plugins:
-        status = getattr(plugin, 'compliance_status', {})
-        if status.get('compliant', False):
+        status = plugin_manager.get_compliance_status(plugin)
+        if status.compliant:
             compliant_plugins.append({
                 "plugin_id": plugin.id,
                 "plugin_name": plugin.name,
-                "response_model": status.get('response_model', 'Unknown')
+                "response_model": status.response_model or 'Unknown'
             })
     
-    return {
+    response = ORJSONResponse({
         "success": True,
         "rule": "ALL PLUGINS MUST DEFINE PYDANTIC RESPONSE MODELS",
         "summary": {
@@ -295,192 +436,211 @@ class Plugin(BasePlugin):
         }
             """
         }
-    }
+    })
+    _compliance_cache = (all_plugins, response.body)
+    return response
 
 
 # ========== CHAIN MANAGEMENT ENDPOINTS ==========
+# Handlers that block on storage are plain functions, so FastAPI runs them in its threadpool
+chains_router = APIRouter(prefix="/api/chains", default_response_class=ORJSONResponse)
 
 @app.get("/chain-builder", response_class=HTMLResponse)
 async def chain_builder(request: Request):
     """Visual chain builder interface"""
-    return templates.TemplateResponse("chain_builder.html", {
-        "request": request
-    })
+    return _render_static_page("chain_builder.html", request)
 
 @app.get("/chains", response_class=HTMLResponse)
-async def chains_list(request: Request):
+def chains_list(request: Request):
     """List all chains interface"""
-    chains = chain_manager.list_chains()
-    return templates.TemplateResponse("chains.html", {
+    chains = chain_manager.list_chain_summaries()
+    return _render_page("chains.html", {
         "request": request,
         "chains": chains
     })
 
-@app.post("/api/chains")
+@chains_router.post("")
 async def create_chain(chain_data: Dict[str, Any]):
     """Create a new plugin chain"""
     try:
         if "definition" in chain_data:
             # Save a complete chain definition
             chain = ChainDefinition(**chain_data["definition"])
-            success = chain_manager.save_chain(chain)
+            success = await chain_manager.asave_chain(chain)
             if success:
                 return {"success": True, "chain_id": chain.id}
             else:
                 raise HTTPException(status_code=500, detail="Failed to save chain")
         else:
             # Create a new empty chain
-            chain = chain_manager.create_chain(
+            chain = await run_in_threadpool(
+                chain_manager.create_chain,
                 name=chain_data.get("name", "Untitled Chain"),
                 description=chain_data.get("description", ""),
                 author=chain_data.get("author")
             )
-            return {"success": True, "chain": chain.dict()}
+            return ORJSONResponse({"success": True, "chain": chain})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/api/chains")
-async def list_chains(tags: str = None, template_only: bool = False):
+@chains_router.get("")
+def list_chains(request: Request, tags: str = None, template_only: bool = False, summary: bool = False, limit: int = None):
     """List all available chains"""
     tag_list = tags.split(",") if tags else None
-    chains = chain_manager.list_chains(tags=tag_list, template_only=template_only)
-    return {
+    if summary:
+        # Served from the metadata index without reading each chain file
+        return _with_etag(request, ORJSONResponse({
+            "success": True,
+            "chains": chain_manager.list_chain_summaries(tags=tag_list, template_only=template_only, limit=limit)
+        }))
+    
+    chains = chain_manager.list_chains(tags=tag_list, template_only=template_only, limit=limit)
+    return _with_etag(request, ORJSONResponse({
         "success": True, 
-        "chains": [chain.dict() for chain in chains]
-    }
+        "chains": chains
+    }))
 
-@app.get("/api/chains/search")
-async def search_chains(q: str = "", tags: str = None):
+@chains_router.get("/search")
+def search_chains(q: str = "", tags: str = None, limit: int = None):
     """Search chains by query and tags"""
     tag_list = tags.split(",") if tags else None
-    results = chain_manager.search_chains(query=q, tags=tag_list)
-    return {"success": True, "results": results}
+    results = chain_manager.search_chains(query=q, tags=tag_list, limit=limit)
+    return ORJSONResponse({"success": True, "results": results})
 
-@app.get("/api/chains/{chain_id}")
-async def get_chain(chain_id: str):
+@chains_router.get("/{chain_id}")
+def get_chain(request: Request, chain_id: str):
     """Get a specific chain definition"""
     chain = chain_manager.load_chain(chain_id)
     if not chain:
-        raise HTTPException(status_code=404, detail="Chain not found")
-    return {"success": True, "chain": chain.dict()}
+        return CHAIN_NOT_FOUND
+    return _with_etag(request, ORJSONResponse({"success": True, "chain": chain}))
 
-@app.put("/api/chains/{chain_id}")
+@chains_router.put("/{chain_id}")
 async def update_chain(chain_id: str, chain_data: Dict[str, Any]):
     """Update a chain definition"""
     try:
         chain = ChainDefinition(**chain_data)
         chain.id = chain_id  # Ensure ID matches URL
-        success = chain_manager.save_chain(chain)
+        success = await chain_manager.asave_chain(chain)
         if success:
-            return {"success": True, "chain": chain.dict()}
+            return ORJSONResponse({"success": True, "chain": chain})
         else:
             raise HTTPException(status_code=500, detail="Failed to update chain")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.delete("/api/chains/{chain_id}")
-async def delete_chain(chain_id: str):
+@chains_router.delete("/{chain_id}")
+def delete_chain(chain_id: str):
     """Delete a chain"""
     success = chain_manager.delete_chain(chain_id)
     if success:
         return {"success": True, "message": "Chain deleted"}
     else:
-        raise HTTPException(status_code=404, detail="Chain not found")
+        return CHAIN_NOT_FOUND
 
-@app.post("/api/chains/{chain_id}/duplicate")
-async def duplicate_chain(chain_id: str, data: Dict[str, Any]):
+@chains_router.post("/{chain_id}/duplicate")
+def duplicate_chain(chain_id: str, data: Dict[str, Any]):
     """Duplicate an existing chain"""
     new_name = data.get("name")
     duplicate = chain_manager.duplicate_chain(chain_id, new_name)
     if duplicate:
-        return {"success": True, "chain": duplicate.dict()}
+        return ORJSONResponse({"success": True, "chain": duplicate})
     else:
-        raise HTTPException(status_code=404, detail="Chain not found")
+        return CHAIN_NOT_FOUND
 
-@app.post("/api/chains/validate")
-async def validate_chain(chain_data: Dict[str, Any]):
+@chains_router.post("/validate")
+def validate_chain(chain_data: Dict[str, Any]):
     """Validate a chain definition"""
     try:
         chain = ChainDefinition(**chain_data)
         validation = chain_manager.validate_chain(chain)
-        return {"success": True, "validation": validation.dict()}
+        return ORJSONResponse({"success": True, "validation": validation})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/api/chains/{chain_id}/execute")
+@chains_router.post("/{chain_id}/execute")
 async def execute_chain(chain_id: str, input_data: Dict[str, Any]):
     """Execute a plugin chain"""
     try:
         result = await chain_manager.execute_chain(chain_id, input_data)
-        return result.dict()
+        return ORJSONResponse(result)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/chains/{chain_id}/history")
-async def get_execution_history(chain_id: str, limit: int = 50):
+@chains_router.get("/{chain_id}/history")
+def get_execution_history(chain_id: str, limit: int = 50):
     """Get execution history for a chain"""
     history = chain_manager.get_execution_history(chain_id, limit)
-    return {
+    return ORJSONResponse({
         "success": True, 
-        "history": [result.dict() for result in history]
-    }
+        "history": history
+    })
 
-@app.get("/api/chains/{chain_id}/analytics")
-async def get_chain_analytics(chain_id: str):
+@chains_router.get("/{chain_id}/analytics")
+def get_chain_analytics(chain_id: str):
     """Get analytics for a specific chain"""
     analytics = chain_manager.get_chain_analytics(chain_id)
     if analytics:
-        return {"success": True, "analytics": analytics.dict()}
+        return ORJSONResponse({"success": True, "analytics": analytics})
     else:
-        return {"success": True, "analytics": None}
+        return ORJSONResponse({"success": True, "analytics": None})
 
 @app.get("/api/system/analytics")
-async def get_system_analytics():
+def get_system_analytics():
     """Get system-wide analytics"""
     analytics = chain_manager.get_system_analytics()
-    return {"success": True, "analytics": analytics}
+    return ORJSONResponse({"success": True, "analytics": analytics})
 
 @app.get("/api/plugins/{plugin_id}/schema")
-async def get_plugin_schema(plugin_id: str):
+def get_plugin_schema(plugin_id: str):
     """Get plugin input/output schema for chain building"""
     schema = chain_manager.get_plugin_schema(plugin_id)
     if not schema:
-        raise HTTPException(status_code=404, detail="Plugin not found")
+        return PLUGIN_NOT_FOUND
     return {"success": True, "schema": schema}
 
-@app.get("/api/chains/{chain_id}/connections/{source_node_id}")
-async def get_compatible_connections(chain_id: str, source_node_id: str):
+@chains_router.get("/{chain_id}/connections/{source_node_id}")
+def get_compatible_connections(chain_id: str, source_node_id: str):
     """Get possible connections from a source node"""
     chain = chain_manager.load_chain(chain_id)
     if not chain:
-        raise HTTPException(status_code=404, detail="Chain not found")
+        return CHAIN_NOT_FOUND
     
     compatible = chain_manager.get_compatible_connections(chain, source_node_id)
     return {"success": True, "compatible_connections": compatible}
 
+app.include_router(chains_router)
+
 # ========== TEMPLATE MANAGEMENT ==========
 
 @app.get("/api/templates")
-async def list_templates(category: str = None):
+def list_templates(request: Request, category: str = None, summary: bool = False, limit: int = None):
     """List all available templates"""
-    templates = chain_manager.list_templates(category=category)
-    return {
+    if summary:
+        # Served from the template index without reading each template file
+        return _with_etag(request, ORJSONResponse({
+            "success": True,
+            "templates": chain_manager.list_template_summaries(category=category, limit=limit)
+        }))
+    
+    templates = chain_manager.list_templates(category=category, limit=limit)
+    return _with_etag(request, ORJSONResponse({
         "success": True, 
-        "templates": [template.dict() for template in templates]
-    }
+        "templates": templates
+    }))
 
 @app.get("/api/templates/{template_id}")
-async def get_template(template_id: str):
+def get_template(request: Request, template_id: str):
     """Get a specific template"""
     template = chain_manager.load_template(template_id)
     if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-    return {"success": True, "template": template.dict()}
+        return TEMPLATE_NOT_FOUND
+    return _with_etag(request, ORJSONResponse({"success": True, "template": template}))
 
 @app.post("/api/templates/{template_id}/create-chain")
-async def create_chain_from_template(template_id: str, data: Dict[str, Any]):
+def create_chain_from_template(template_id: str, data: Dict[str, Any]):
     """Create a new chain from a template"""
     chain = chain_manager.create_chain_from_template(
         template_id, 
@@ -488,9 +648,9 @@ async def create_chain_from_template(template_id: str, data: Dict[str, Any]):
         data.get("author")
     )
     if chain:
-        return {"success": True, "chain": chain.dict()}
+        return ORJSONResponse({"success": True, "chain": chain})
     else:
-        raise HTTPException(status_code=404, detail="Template not found")
+        return TEMPLATE_NOT_FOUND
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Optional, Union, Type
 from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 
@@ -41,6 +42,33 @@ class PluginDependencies(BaseModel):
     python: Optional[List[Dependency]] = None
 
 
+@dataclass(slots=True)
+class DependencyDetail:
+    name: str
+    met: bool
+
+
+@dataclass(slots=True)
+class DependencyStatus:
+    all_met: bool = True
+    details: List[DependencyDetail] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DependencyStatus":
+        return cls(data["all_met"], [DependencyDetail(**detail) for detail in data["details"]])
+
+
+@dataclass(slots=True)
+class ComplianceStatus:
+    compliant: bool
+    error: Optional[str] = None
+    response_model: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ComplianceStatus":
+        return cls(**data)
+
+
 class PluginManifest(BaseModel):
     id: str = Field(..., description="Unique plugin identifier")
     name: str = Field(..., description="Human-readable plugin name")
@@ -51,9 +79,14 @@ class PluginManifest(BaseModel):
     output: OutputFormat = Field(..., description="Output format specification")
     tags: Optional[List[str]] = Field(default=None, description="Plugin tags for categorization")
     dependencies: Optional[PluginDependencies] = Field(default=None, description="Plugin dependencies")
+    pure: bool = Field(default=False, description="Same input always gives the same output, so results may be cached")
+    stateful: bool = Field(default=False, description="Needs a fresh plugin instance for every execution")
+    trusted: bool = Field(default=False, description="Execute results are trusted to match the response model")
+    dependency_status: Optional[DependencyStatus] = Field(default=None, description="Result of the last dependency check")
+    compliance_status: Optional[ComplianceStatus] = Field(default=None, description="Result of the last compliance check")
 
     class Config:
-        extra = "allow"
+        extra = "ignore"
 
 
 class PluginInput(BaseModel):
@@ -73,6 +106,12 @@ class BasePluginResponse(BaseModel):
     pass
 
 
+class FileResult(BasePluginResponse):
+    """Base class for plugin responses that produce a downloadable file"""
+    file_path: str = Field(..., description="Path to the generated file")
+    file_name: str = Field(..., description="Name of the generated file")
+
+
 class BasePlugin(ABC):
     """
     Base class for all plugins. 
@@ -94,7 +133,8 @@ class BasePlugin(ABC):
                   handle both cases gracefully.
             
         Returns:
-            Dictionary that MUST validate against the model returned by get_response_model()
+            Dictionary that MUST validate against the model returned by get_response_model(),
+            or an instance of that model (which is then used as-is without re-validation)
         """
         pass
     
@@ -125,5 +165,21 @@ class BasePlugin(ABC):
         Raises:
             ValidationError: If the response doesn't match the model
         """
-        response_model = self.get_response_model()
-        return response_model(**response_data) 
\ No newline at end of file
+        return self.get_response_model().model_validate(response_data)
+    
+    @staticmethod
+    def read_input_file(file_info: Dict[str, Any]) -> bytes:
+        """
+        Read the bytes of an uploaded file passed in the plugin input.
+        
+        Args:
+            file_info: The 'input_file' dictionary, holding either a 'temp_path'
+                       (upload streamed to disk) or 'content' (in-memory bytes)
+            
+        Returns:
+            The file content
+        """
+        if "temp_path" in file_info:
+            with open(file_info["temp_path"], "rb") as f:
+                return f.read()
+        return file_info["content"] 
\ No newline at end of file
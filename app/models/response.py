@@ -1,5 +1,5 @@
 from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from .plugin import PluginManifest
 
 
@@ -11,11 +11,12 @@ class APIResponse(BaseModel):
 
 class PluginListResponse(BaseModel):
     success: bool
-    count: int = 0
     plugins: List[PluginManifest] = []
 
-    def __init__(self, success: bool, plugins: List[PluginManifest], **kwargs):
-        super().__init__(success=success, count=len(plugins), plugins=plugins, **kwargs)
+    @computed_field
+    @property
+    def count(self) -> int:
+        return len(self.plugins)
 
 
 class PluginExecutionResponse(BaseModel):
@@ -1,4 +1,3 @@
-import json
 from typing import Dict, Any, Type
 from pydantic import BaseModel, Field
 from ...models.plugin import BasePlugin, BasePluginResponse
@@ -8,7 +7,7 @@ from .models import PrincipiaDocument
 class DocViewerResponse(BasePluginResponse):
     """Pydantic model for document viewer plugin response"""
     custom_template: str = Field(..., description="Name of the custom template to use for rendering")
-    document: Dict[str, Any] = Field(..., description="Document data for rendering")
+    document: PrincipiaDocument = Field(..., description="Document data for rendering")
 
 
 class Plugin(BasePlugin):
@@ -31,13 +30,13 @@ class Plugin(BasePlugin):
             raise ValueError("Missing JSON file input")
 
         try:
-            json_content = file_info["content"].decode("utf-8")
-            document_data = json.loads(json_content)
-            document = PrincipiaDocument(**document_data)
+            # Parsed and validated in one pass, straight from the raw bytes
+            document = PrincipiaDocument.model_validate_json(self.read_input_file(file_info))
             
             return {
                 "custom_template": "doc_viewer_view.html",
-                "document": document.model_dump()
+                # Kept as the validated model; it is dumped once with the rest of the response
+                "document": document
             }
         except Exception as e:
             raise ValueError(f"Error processing document: {e}") 
\ No newline at end of file
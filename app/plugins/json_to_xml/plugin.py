@@ -1,97 +1,185 @@
-import json
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Type
+import orjson
+from typing import Callable, Dict, Any, List, Type
 import tempfile
 from pathlib import Path
 from pydantic import BaseModel, Field
-from ...models.plugin import BasePlugin, BasePluginResponse
+from ...models.plugin import BasePlugin, BasePluginResponse, FileResult
 
-# Use the pandoc library for parsing
-import pandoc
-from pandoc.types import (
-    Pandoc, Meta, Block, Inline, Str, Space, Code, Emph, Strong, SoftBreak,
-    LineBreak, Para, Plain, Header, CodeBlock, BulletList, BlockQuote, Div,
-    RawBlock, RawInline, Link, Image, Span, HorizontalRule, Table
-)
+# lxml builds and serializes the tree in C; ElementTree has the same element API
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
-def _emit_inlines(parent: ET.Element, lst: List[Inline], ignore_line_breaks: bool = False):
+# Pandoc JSON is walked as plain dicts: every node is {"t": <type>, "c": <contents>}
+def _plain_text(lst: List[Dict[str, Any]]) -> str:
+    """Flatten inlines to plain text, as used for image alt text"""
+    parts = []
     for inl in lst:
-        if isinstance(inl, Str):
-            parent.text = (parent.text or "") + inl[0]
-        elif isinstance(inl, Space):
-            parent.text = (parent.text or "") + " "
-        elif isinstance(inl, Code):
-            attr, text = inl
-            ET.SubElement(parent, "C").text = text
-        elif isinstance(inl, Emph):
-            e = ET.SubElement(parent, "E")
-            _emit_inlines(e, inl[0], ignore_line_breaks)
-        elif isinstance(inl, Strong):
-            s = ET.SubElement(parent, "S")
-            _emit_inlines(s, inl[0], ignore_line_breaks)
-        elif isinstance(inl, (SoftBreak, LineBreak)):
-            if not ignore_line_breaks:
-                ET.SubElement(parent, "BR")
-        elif isinstance(inl, RawInline):
-            format_obj, text = inl
-            ET.SubElement(parent, "Raw", format=format_obj[0]).text = text
-        elif isinstance(inl, Link):
-            attr, inlines, target = inl
-            href, title = target
-            a = ET.SubElement(parent, "A", href=href, title=title)
-            _emit_inlines(a, inlines, ignore_line_breaks)
-        elif isinstance(inl, Image):
-            attr, inlines, target = inl
-            src, title = target
-            alt_text = pandoc.write(inlines, format='plain').strip()
-            ET.SubElement(parent, "IMG", src=src, title=title, alt=alt_text)
-        elif isinstance(inl, Span):
-            attr, inlines = inl
-            s = ET.SubElement(parent, "SPAN")
-            _emit_inlines(s, inlines, ignore_line_breaks)
+        t = inl["t"]
+        if t == "Str":
+            parts.append(inl["c"])
+        elif t in ("Space", "SoftBreak", "LineBreak"):
+            parts.append(" ")
+        elif t == "Code":
+            parts.append(inl["c"][1])
+        elif t in ("Emph", "Strong"):
+            parts.append(_plain_text(inl["c"]))
+        elif t in ("Link", "Image", "Span"):
+            parts.append(_plain_text(inl["c"][1]))
+    return "".join(parts)
+
+def _flush_text(parent: ET.Element, buf: List[str]):
+    """Attach buffered text after the parent's last child, or as its text if it has none"""
+    text = "".join(buf)
+    buf.clear()
+    if len(parent):
+        parent[-1].tail = text
+    else:
+        parent.text = text
+
+# Node handlers take the parent element, the node's "c" contents and the line-break setting;
+# dispatch is one dict lookup on the node type instead of a chain of comparisons
+def _emit_code(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    attr, text = c
+    ET.SubElement(parent, "C").text = text
+
+def _emit_emph(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    _emit_inlines(ET.SubElement(parent, "E"), c, ignore_line_breaks)
+
+def _emit_strong(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    _emit_inlines(ET.SubElement(parent, "S"), c, ignore_line_breaks)
+
+def _emit_break(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    ET.SubElement(parent, "BR")
+
+def _emit_raw_inline(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    format_name, text = c
+    ET.SubElement(parent, "Raw", format=format_name).text = text
+
+def _emit_link(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    attr, inlines, target = c
+    href, title = target
+    _emit_inlines(ET.SubElement(parent, "A", href=href, title=title), inlines, ignore_line_breaks)
+
+def _emit_image(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    attr, inlines, target = c
+    src, title = target
+    ET.SubElement(parent, "IMG", src=src, title=title, alt=_plain_text(inlines).strip())
+
+def _emit_span(parent: ET.Element, c: Any, ignore_line_breaks: bool):
+    attr, inlines = c
+    _emit_inlines(ET.SubElement(parent, "SPAN"), inlines, ignore_line_breaks)
+
+_INLINE_HANDLERS: Dict[str, Callable[[ET.Element, Any, bool], None]] = {
+    "Code": _emit_code,
+    "Emph": _emit_emph,
+    "Strong": _emit_strong,
+    "SoftBreak": _emit_break,
+    "LineBreak": _emit_break,
+    "RawInline": _emit_raw_inline,
+    "Link": _emit_link,
+    "Image": _emit_image,
+    "Span": _emit_span,
+}
+
+def _emit_inlines(parent: ET.Element, lst: List[Dict[str, Any]], ignore_line_breaks: bool = False):
+    # Text runs are buffered and joined once instead of re-concatenated per word
+    buf: List[str] = []
+    for inl in lst:
+        t = inl["t"]
+        if t == "Str":
+            buf.append(inl["c"])
+            continue
+        if t == "Space":
+            buf.append(" ")
+            continue
+        if t in ("SoftBreak", "LineBreak") and ignore_line_breaks:
+            continue
+        if buf:
+            _flush_text(parent, buf)
+        handler = _INLINE_HANDLERS.get(t)
+        if handler is None:
+            ET.SubElement(parent, "U", t=t)
         else:
-            ET.SubElement(parent, "U", t=type(inl).__name__)
-
-def _emit(root: ET.Element, node: Block, ignore_line_breaks: bool = False):
-    if isinstance(node, (Para, Plain)):
-        elem = ET.SubElement(root, "P")
-        _emit_inlines(elem, node[0], ignore_line_breaks)
-    elif isinstance(node, Header):
-        level, attr, inlines = node
-        elem = ET.SubElement(root, "H", l=str(level))
-        _emit_inlines(elem, inlines, ignore_line_breaks)
-    elif isinstance(node, CodeBlock):
-        attr, text = node
-        lang = attr[1][0] if attr[1] else ""
-        ET.SubElement(root, "C", l=lang).text = text
-    elif isinstance(node, BulletList):
-        l = ET.SubElement(root, "L")
-        for item in node[0]:
-            i = ET.SubElement(l, "I")
-            for blk in item:
-                _emit(i, blk, ignore_line_breaks)
-    elif isinstance(node, BlockQuote):
-        q = ET.SubElement(root, "Q")
-        for blk in node[0]:
-            _emit(q, blk, ignore_line_breaks)
-    elif isinstance(node, Div):
-        attr, blocks = node
-        div_elem = ET.SubElement(root, "DIV")
-        for blk in blocks:
-            _emit(div_elem, blk, ignore_line_breaks)
-    elif isinstance(node, RawBlock):
-        format_obj, text = node
-        ET.SubElement(root, "RawBlock", format=format_obj[0]).text = text
-    elif isinstance(node, HorizontalRule):
-        ET.SubElement(root, "HR")
-    elif isinstance(node, Table):
-        # For now, just a placeholder for tables
-        ET.SubElement(root, "Table").text = "[Table content]"
+            handler(parent, inl.get("c"), ignore_line_breaks)
+    if buf:
+        _flush_text(parent, buf)
+
+def _emit_para(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    _emit_inlines(ET.SubElement(root, "P"), c, ignore_line_breaks)
+
+def _emit_header(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    level, attr, inlines = c
+    _emit_inlines(ET.SubElement(root, "H", l=str(level)), inlines, ignore_line_breaks)
+
+def _emit_code_block(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    attr, text = c
+    lang = attr[1][0] if attr[1] else ""
+    ET.SubElement(root, "C", l=lang).text = text
+
+def _emit_bullet_list(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    l = ET.SubElement(root, "L")
+    for item in c:
+        i = ET.SubElement(l, "I")
+        for blk in item:
+            _emit(i, blk, ignore_line_breaks)
+
+def _emit_block_quote(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    q = ET.SubElement(root, "Q")
+    for blk in c:
+        _emit(q, blk, ignore_line_breaks)
+
+def _emit_div(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    attr, blocks = c
+    div_elem = ET.SubElement(root, "DIV")
+    for blk in blocks:
+        _emit(div_elem, blk, ignore_line_breaks)
+
+def _emit_raw_block(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    format_name, text = c
+    ET.SubElement(root, "RawBlock", format=format_name).text = text
+
+def _emit_horizontal_rule(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    ET.SubElement(root, "HR")
+
+def _emit_table(root: ET.Element, c: Any, ignore_line_breaks: bool):
+    # For now, just a placeholder for tables
+    ET.SubElement(root, "Table").text = "[Table content]"
+
+_BLOCK_HANDLERS: Dict[str, Callable[[ET.Element, Any, bool], None]] = {
+    "Para": _emit_para,
+    "Plain": _emit_para,
+    "Header": _emit_header,
+    "CodeBlock": _emit_code_block,
+    "BulletList": _emit_bullet_list,
+    "BlockQuote": _emit_block_quote,
+    "Div": _emit_div,
+    "RawBlock": _emit_raw_block,
+    "HorizontalRule": _emit_horizontal_rule,
+    "Table": _emit_table,
+}
+
+def _emit(root: ET.Element, node: Dict[str, Any], ignore_line_breaks: bool = False):
+    t = node["t"]
+    handler = _BLOCK_HANDLERS.get(t)
+    if handler is None:
+        ET.SubElement(root, "U", t=t)
     else:
-        ET.SubElement(root, "U", t=type(node).__name__)
+        handler(root, node.get("c"), ignore_line_breaks)
+
+
+def _to_xml_string(root: ET.Element) -> str:
+    """Serialize the tree indented, in one pass when lxml is available"""
+    if LXML_AVAILABLE:
+        return ET.tostring(root, encoding="unicode", pretty_print=True)
+    ET.indent(root)
+    return ET.tostring(root, encoding="unicode")
 
 
-class JsonToXmlResponse(BasePluginResponse):
+class JsonToXmlResponse(FileResult):
     """Pydantic model for JSON to XML converter plugin response"""
     file_path: str = Field(..., description="Path to the converted XML file")
     file_name: str = Field(..., description="Name of the converted XML file")
@@ -112,8 +200,7 @@ class Plugin(BasePlugin):
 
         try:
             ignore_line_breaks = data.get("ignore_line_breaks", False)
-            json_string = file_info["content"].decode("utf-8")
-            api_version = []
+            json_bytes = self.read_input_file(file_info)
             
             temp_dir = tempfile.mkdtemp()
             input_filename = Path(file_info["filename"])
@@ -121,12 +208,11 @@ class Plugin(BasePlugin):
             output_path = Path(temp_dir) / output_filename
             
             try:
-                raw_doc = json.loads(json_string)
-                if isinstance(raw_doc, dict):
-                    api_version = raw_doc.get("pandoc-api-version", [])
-                doc = pandoc.read(json_string, format='json')
+                # Parsed once; the emitter reads the node dicts directly
+                raw_doc = orjson.loads(json_bytes)
+                api_version = raw_doc.get("pandoc-api-version", [])
+                blocks = raw_doc["blocks"]
                 
-                meta, blocks = doc
                 root = ET.Element("D", v=".".join(map(str, api_version)))
                 
                 ET.SubElement(root, "M")
@@ -135,14 +221,12 @@ class Plugin(BasePlugin):
                 for blk in blocks:
                     _emit(xml_blocks, blk, ignore_line_breaks)
                 
-                ET.indent(root)
-                xml_output = ET.tostring(root, encoding="unicode")
+                xml_output = _to_xml_string(root)
 
             except Exception:
                 root = ET.Element("D")
-                ET.SubElement(root, "B").text = json_string
-                ET.indent(root)
-                xml_output = ET.tostring(root, encoding="unicode")
+                ET.SubElement(root, "B").text = json_bytes.decode("utf-8")
+                xml_output = _to_xml_string(root)
 
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(xml_output)
@@ -1,29 +1,34 @@
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pydantic import BaseModel, Field
-from ...models.plugin import BasePluginResponse
+from ...models.plugin import FileResult
+
+
+_FORMAT_TO_EXTENSION = {
+    'plain': 'txt',
+    'markdown': 'md', 
+    'html': 'html',
+    'html5': 'html',
+    'latex': 'tex',
+    'pdf': 'pdf',
+    'docx': 'docx',
+    'odt': 'odt',
+    'rtf': 'rtf',
+    'epub': 'epub',
+    'json': 'json',
+    'txt': 'txt',
+    'md': 'md'
+}
 
 
 def get_output_extension(output_format: str) -> str:
     """Map output format to file extension"""
-    format_to_extension = {
-        'plain': 'txt',
-        'markdown': 'md', 
-        'html': 'html',
-        'html5': 'html',
-        'latex': 'tex',
-        'pdf': 'pdf',
-        'docx': 'docx',
-        'odt': 'odt',
-        'rtf': 'rtf',
-        'epub': 'epub',
-        'json': 'json',
-        'txt': 'txt',
-        'md': 'md'
-    }
-    return format_to_extension.get(output_format.lower(), output_format)
+    extension = _FORMAT_TO_EXTENSION.get(output_format)
+    if extension is not None:
+        return extension
+    return _FORMAT_TO_EXTENSION.get(output_format.lower(), output_format)
 
 
 class ProcessingMethod(Enum):
@@ -31,9 +36,10 @@ class ProcessingMethod(Enum):
     SINGLE_FILE = "single_file"
     CHUNKED = "chunked"
     TEXT_EXTRACTION = "text_extraction"
+    IDENTITY = "identity"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Configuration for pandoc processing"""
     chunk_size: int = 10 * 1024 * 1024  # 10MB
@@ -42,17 +48,12 @@ class ProcessingConfig:
     chunking_threshold: int = 50 * 1024 * 1024  # 50MB
     text_extraction_threshold: int = 200 * 1024 * 1024  # 200MB
     success_rate_threshold: float = 0.5  # 50%
-    advanced_options: List[str] = None
-    features: List[str] = None
-    
-    def __post_init__(self):
-        if self.advanced_options is None:
-            self.advanced_options = []
-        if self.features is None:
-            self.features = []
+    max_parallel_chunks: int = 4  # Chunks converted at once
+    advanced_options: List[str] = field(default_factory=list)
+    features: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class InputFileInfo:
     """Information about input file"""
     filename: str
@@ -65,7 +66,7 @@ class InputFileInfo:
         return round(self.size / (1024 * 1024), 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryStatus:
     """Memory usage information"""
     process_memory_mb: float
@@ -74,7 +75,7 @@ class MemoryStatus:
     memory_usage_percent: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkResult:
     """Result of processing a single chunk"""
     chunk_id: int
@@ -85,7 +86,7 @@ class ChunkResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing operation"""
     success: bool
@@ -93,15 +94,11 @@ class ProcessingResult:
     method: ProcessingMethod = ProcessingMethod.SINGLE_FILE
     chunk_count: int = 0
     success_rate: float = 1.0
-    memory_monitoring: Dict[str, Any] = None
+    memory_monitoring: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.memory_monitoring is None:
-            self.memory_monitoring = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingContext:
     """Context for processing operations"""
     input_info: InputFileInfo
@@ -110,9 +107,14 @@ class ProcessingContext:
     output_format: str
     complete_output_format: str
     self_contained: bool = False
+    output_dir: Optional[Path] = None  # Where the final output is written; defaults to temp_dir
+    
+    def __post_init__(self):
+        if self.output_dir is None:
+            self.output_dir = self.temp_dir
 
 
-class PandocConverterResponse(BasePluginResponse):
+class PandocConverterResponse(FileResult):
     """Pydantic model for pandoc converter plugin response"""
     file_path: str = Field(..., description="Path to the converted file")
     file_name: str = Field(..., description="Name of the converted file")
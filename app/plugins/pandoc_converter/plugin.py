@@ -9,14 +9,14 @@ from ...models.plugin import BasePlugin
 # Import all components from refactored modules
 from .models import (
     ProcessingConfig, InputFileInfo, ProcessingContext, 
-    PandocConverterResponse
+    PandocConverterResponse, get_output_extension
 )
 from .services import (
     MemoryMonitor, FileHandler, PandocExecutor, 
     TextExtractor, ChunkingService
 )
 from .strategies import (
-    SingleFileStrategy, ChunkedStrategy, TextExtractionStrategy
+    SingleFileStrategy, ChunkedStrategy, TextExtractionStrategy, IdentityStrategy
 )
 
 # Set up logging
@@ -40,6 +40,7 @@ class Plugin(BasePlugin):
             self.pandoc_executor, self.memory_monitor, self.chunking_service, self.text_extractor
         )
         self.text_extraction_strategy = TextExtractionStrategy(self.text_extractor, self.memory_monitor)
+        self.identity_strategy = IdentityStrategy()
     
     @classmethod
     def get_response_model(cls) -> Type[PandocConverterResponse]:
@@ -77,10 +78,9 @@ class Plugin(BasePlugin):
             input_file_content = input_file_info["content"]
             file_size = len(input_file_content)
             
-            # Write input file to temp directory
+            # Write input file to temp directory (one unbuffered write)
             input_path = temp_dir / input_filename
-            with open(input_path, "wb") as f:
-                f.write(input_file_content)
+            input_path.write_bytes(input_file_content)
             logger.info(f"Wrote legacy content to processing directory: {input_path}")
         
         # Validate input file
@@ -100,11 +100,17 @@ class Plugin(BasePlugin):
             features=validated_features
         )
     
-    def _select_strategy(self, file_info: InputFileInfo, config: ProcessingConfig):
+    def _select_strategy(self, context: ProcessingContext):
         """Select appropriate processing strategy based on file characteristics"""
+        file_info, config = context.input_info, context.config
         file_size = file_info.size
         file_ext = file_info.extension
         
+        # Plain conversion into the input's own format: nothing for pandoc to do
+        if (file_ext.lstrip('.') == get_output_extension(context.output_format)
+                and not config.advanced_options and not config.features and not context.self_contained):
+            return self.identity_strategy
+        
         # For very large HTML files, use direct text extraction
         if file_size > config.text_extraction_threshold and file_ext.lower() == '.html':
             logger.info(f"Large HTML file detected ({file_info.size_mb}MB), using text extraction strategy")
@@ -121,13 +127,14 @@ class Plugin(BasePlugin):
             return self.single_file_strategy
     
     def _create_processing_context(self, file_info: InputFileInfo, config: ProcessingConfig, 
-                                 temp_dir: Path, output_format: str, complete_output_format: str,
+                                 temp_dir: Path, output_dir: Path, output_format: str, complete_output_format: str,
                                  self_contained: bool) -> ProcessingContext:
         """Create processing context"""
         return ProcessingContext(
             input_info=file_info,
             config=config,
             temp_dir=temp_dir,
+            output_dir=output_dir,
             output_format=output_format,
             complete_output_format=complete_output_format,
             self_contained=self_contained
@@ -137,7 +144,10 @@ class Plugin(BasePlugin):
                         pandoc_version: str, context: ProcessingContext) -> Dict[str, Any]:
         """Format the final response"""
         # Get output size from permanent file location (since temp file was moved)
-        output_size = permanent_file_path.stat().st_size if permanent_file_path and permanent_file_path.exists() else 0
+        try:
+            output_size = permanent_file_path.stat().st_size if permanent_file_path else 0
+        except FileNotFoundError:
+            output_size = 0
         
         conversion_details = {
             "pandoc_version": pandoc_version,
@@ -173,6 +183,7 @@ class Plugin(BasePlugin):
     def execute(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Main execute method - clean and focused"""
         temp_dir = None
+        output_dir = None
         
         try:
             # 1. Parse and validate input
@@ -181,6 +192,7 @@ class Plugin(BasePlugin):
             # 2. Setup temporary directory and input file
             temp_dir = self.file_handler.setup_temp_directory()
             file_info = self._setup_input_file(input_file_info, temp_dir)
+            output_dir = self.file_handler.setup_output_directory()
             
             # 3. Create processing configuration
             config = self._create_processing_config(advanced_options, features)
@@ -190,11 +202,11 @@ class Plugin(BasePlugin):
             
             # 5. Create processing context
             context = self._create_processing_context(
-                file_info, config, temp_dir, output_format, complete_output_format, self_contained
+                file_info, config, temp_dir, output_dir, output_format, complete_output_format, self_contained
             )
             
             # 6. Select and execute processing strategy
-            strategy = self._select_strategy(file_info, config)
+            strategy = self._select_strategy(context)
             result = strategy.process(context)
             
             # 7. Handle processing result
@@ -237,6 +249,8 @@ class Plugin(BasePlugin):
             # Clean up temporary directory
             if temp_dir:
                 self.file_handler.cleanup(temp_dir)
+            if output_dir:
+                self.file_handler.cleanup(output_dir)
     
     def _validate_advanced_options(self, advanced_options: Union[str, List[str], None]) -> List[str]:
         """Validate and parse advanced pandoc options"""
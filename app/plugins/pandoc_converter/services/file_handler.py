@@ -39,6 +39,11 @@ class FileHandler:
         logger.info(f"Created temporary directory: {temp_dir}")
         return temp_dir
     
+    def setup_output_directory(self) -> Path:
+        """Create a staging directory on the downloads filesystem, so finished output is renamed rather than copied"""
+        self.downloads_dir.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix=".staging-", dir=self.downloads_dir))
+    
     def move_to_downloads(self, temp_file_path: Path, filename: str) -> Path:
         """Move file from temp directory to permanent downloads directory"""
         self.downloads_dir.mkdir(parents=True, exist_ok=True)
@@ -1,3 +1,7 @@
+import functools
+import os
+import resource
+import shutil
 import subprocess
 import threading
 import time
@@ -9,6 +13,12 @@ from .memory import MemoryMonitor
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Bounds the pandoc processes running at once across all conversions in this process
+_PANDOC_SLOTS = threading.BoundedSemaphore(max(2, os.cpu_count() or 1))
+
+# Exit status of a GHC program whose heap allocation failed (e.g. under RLIMIT_AS)
+_PANDOC_OUT_OF_MEMORY = 251
+
 
 class PandocExecutor:
     """Handles pandoc command execution with memory monitoring"""
@@ -19,7 +29,7 @@ class PandocExecutor:
     def build_command(self, input_path: Path, output_path: Path, output_format: str, 
                      advanced_options: List[str], self_contained: bool) -> List[str]:
         """Build pandoc command for execution"""
-        command = ["pandoc"]
+        command = [_pandoc_executable()]
         
         # Add advanced options first
         if advanced_options:
@@ -46,17 +56,27 @@ class PandocExecutor:
         """Execute pandoc command with memory monitoring and limits"""
         try:
             chunk_suffix = f"_chunk_{chunk_num}" if chunk_num else ""
-            stdout_log = temp_dir / f"pandoc_stdout{chunk_suffix}.log"
             stderr_log = temp_dir / f"pandoc_stderr{chunk_suffix}.log"
             
             logger.info(f"Executing pandoc{' for chunk ' + str(chunk_num) if chunk_num else ''}: {' '.join(command)}")
             
-            with open(stdout_log, 'w') as stdout_f, open(stderr_log, 'w') as stderr_f:
-                # Start process
+            # Cap pandoc's address space so a runaway conversion fails instead of swapping the host
+            memory_limit_bytes = memory_limit_mb * 1024 * 1024
+            prlimit = _prlimit_executable()
+            if prlimit:
+                command = [prlimit, f"--as={memory_limit_bytes}", *command]
+                preexec_fn = None
+            else:
+                preexec_fn = functools.partial(_limit_address_space, memory_limit_bytes)
+            
+            with _PANDOC_SLOTS, open(stderr_log, 'w') as stderr_f:
+                # Start process; output goes to -o, so stdout carries nothing worth keeping
                 process = subprocess.Popen(
                     command,
-                    stdout=stdout_f,
-                    stderr=stderr_f
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_f,
+                    close_fds=False,
+                    preexec_fn=preexec_fn
                 )
                 
                 # Start memory monitoring in background
@@ -87,6 +107,9 @@ class PandocExecutor:
             elif result == -15:  # SIGTERM (our memory limit)
                 logger.error(f"Pandoc terminated due to memory limit{' for chunk ' + str(chunk_num) if chunk_num else ''}")
                 return False
+            elif result == _PANDOC_OUT_OF_MEMORY:  # address space cap reached
+                logger.error(f"Pandoc exceeded memory budget of {memory_limit_mb}MB{' for chunk ' + str(chunk_num) if chunk_num else ''}")
+                return False
             else:
                 # Read limited error output
                 stderr_content = ""
@@ -105,12 +128,42 @@ class PandocExecutor:
     def get_version(self) -> str:
         """Get pandoc version for diagnostics"""
         try:
-            result = subprocess.run(
-                ["pandoc", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.stdout.split('\n')[0] if result.returncode == 0 else "unknown"
+            return _pandoc_version()
         except Exception:
-            return "unknown" 
\ No newline at end of file
+            return "unknown"
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_executable() -> str:
+    """Resolve pandoc on PATH once.
+
+    With an absolute executable, close_fds=False and no preexec_fn, subprocess launches
+    through os.posix_spawn instead of forking the (large) server process. Descriptors
+    Python opens are non-inheritable by default, so close_fds=False leaks nothing.
+    """
+    return shutil.which("pandoc") or "pandoc"
+
+
+@functools.lru_cache(maxsize=1)
+def _prlimit_executable() -> Optional[str]:
+    """Resolve util-linux prlimit once; wrapping pandoc in it keeps the posix_spawn launch path"""
+    return shutil.which("prlimit")
+
+
+def _limit_address_space(limit_bytes: int) -> None:
+    """preexec_fn fallback when prlimit is unavailable (forces a fork+exec launch)"""
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_version() -> str:
+    """First line of `pandoc --version`, run once per process; failures raise and are retried"""
+    result = subprocess.run(
+        [_pandoc_executable(), "--version"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+        check=True,
+        close_fds=False
+    )
+    return result.stdout.split('\n')[0]
@@ -4,10 +4,12 @@ from .base import ProcessingStrategy
 from .single_file import SingleFileStrategy
 from .chunked import ChunkedStrategy
 from .text_extraction import TextExtractionStrategy
+from .identity import IdentityStrategy
 
 __all__ = [
     'ProcessingStrategy',
     'SingleFileStrategy',
     'ChunkedStrategy',
-    'TextExtractionStrategy'
+    'TextExtractionStrategy',
+    'IdentityStrategy'
 ] 
\ No newline at end of file
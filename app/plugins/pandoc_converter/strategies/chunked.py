@@ -1,4 +1,6 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from .base import ProcessingStrategy
 from ..models import ProcessingContext, ProcessingResult, ProcessingMethod, ChunkResult, get_output_extension
 from ..services import PandocExecutor, MemoryMonitor, ChunkingService, TextExtractor
@@ -31,54 +33,17 @@ class ChunkedStrategy(ProcessingStrategy):
                 context.input_info.path, context.temp_dir, context.config.chunk_size
             )
             
-            # Process each chunk
-            processed_chunks = []
-            chunk_results = []
-            
             # Get proper output extension
             output_extension = get_output_extension(context.output_format)
             
-            for i, chunk_path in enumerate(chunk_paths):
-                try:
-                    logger.info(f"Processing chunk {i+1}/{len(chunk_paths)}: {chunk_path.name}")
-                    
-                    # Process individual chunk with proper extension
-                    chunk_output_filename = f"{chunk_path.stem}.{output_extension}"
-                    chunk_output_path = context.temp_dir / chunk_output_filename
-                    
-                    # Build pandoc command for chunk
-                    chunk_command = self.pandoc_executor.build_command(
-                        chunk_path, chunk_output_path, context.complete_output_format,
-                        context.config.advanced_options, context.self_contained
-                    )
-                    
-                    # Execute pandoc on chunk
-                    chunk_success = self.pandoc_executor.execute_with_monitoring(
-                        chunk_command, context.temp_dir, context.config.memory_limit, 
-                        context.config.timeout, i+1
-                    )
-                    
-                    chunk_result = ChunkResult(
-                        chunk_id=i+1,
-                        success=chunk_success,
-                        output_path=chunk_output_path if chunk_success else None
-                    )
-                    chunk_results.append(chunk_result)
-                    
-                    if chunk_success and chunk_output_path.exists():
-                        processed_chunks.append(chunk_output_path)
-                        logger.info(f"Successfully processed chunk {i+1}")
-                    else:
-                        logger.warning(f"Failed to process chunk {i+1}")
-                        
-                except Exception as chunk_error:
-                    logger.error(f"Error processing chunk {i+1}: {chunk_error}")
-                    chunk_results.append(ChunkResult(
-                        chunk_id=i+1,
-                        success=False,
-                        error=str(chunk_error)
-                    ))
-                    continue
+            # Chunks are independent, so they convert concurrently; results keep chunk order
+            max_workers = max(1, min(context.config.max_parallel_chunks, len(chunk_paths)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pandoc-chunk") as executor:
+                chunk_results = list(executor.map(
+                    lambda item: self._process_chunk(item[0] + 1, item[1], context, output_extension),
+                    enumerate(chunk_paths)
+                ))
+            processed_chunks = [result.output_path for result in chunk_results if result.output_path]
             
             success_rate = len(processed_chunks) / len(chunk_paths)
             logger.info(f"Chunk processing success rate: {success_rate:.1%} ({len(processed_chunks)}/{len(chunk_paths)})")
@@ -87,7 +52,7 @@ class ChunkedStrategy(ProcessingStrategy):
                 # All chunks failed - try text extraction fallback
                 logger.warning("All chunks failed, attempting text extraction fallback")
                 output_path = self.text_extractor.extract_from_html(
-                    context.input_info.path, context.output_format, context.temp_dir
+                    context.input_info.path, context.output_format, context.output_dir
                 )
                 return ProcessingResult(
                     success=True,
@@ -100,7 +65,7 @@ class ChunkedStrategy(ProcessingStrategy):
                 # Low success rate - try text extraction fallback
                 logger.warning(f"Low success rate ({success_rate:.1%}), trying text extraction fallback")
                 output_path = self.text_extractor.extract_from_html(
-                    context.input_info.path, context.output_format, context.temp_dir
+                    context.input_info.path, context.output_format, context.output_dir
                 )
                 return ProcessingResult(
                     success=True,
@@ -113,7 +78,7 @@ class ChunkedStrategy(ProcessingStrategy):
                 # Merge successful chunks
                 logger.info(f"Merging {len(processed_chunks)} successfully processed chunks")
                 output_path = self.chunking_service.merge_chunks(
-                    processed_chunks, output_extension, context.temp_dir, context.input_info.path.stem
+                    processed_chunks, output_extension, context.output_dir, context.input_info.path.stem
                 )
                 
                 # Final memory check
@@ -137,4 +102,37 @@ class ChunkedStrategy(ProcessingStrategy):
                 success=False,
                 method=ProcessingMethod.CHUNKED,
                 error=str(e)
-            ) 
\ No newline at end of file
+            )
+    
+    def _process_chunk(self, chunk_id: int, chunk_path: Path, context: ProcessingContext,
+                       output_extension: str) -> ChunkResult:
+        """Convert one chunk; output_path is set only when its output was written"""
+        try:
+            logger.info(f"Processing chunk {chunk_id}: {chunk_path.name}")
+            
+            # Process individual chunk with proper extension
+            chunk_output_filename = f"{chunk_path.stem}.{output_extension}"
+            chunk_output_path = context.temp_dir / chunk_output_filename
+            
+            # Build pandoc command for chunk
+            chunk_command = self.pandoc_executor.build_command(
+                chunk_path, chunk_output_path, context.complete_output_format,
+                context.config.advanced_options, context.self_contained
+            )
+            
+            # Execute pandoc on chunk
+            chunk_success = self.pandoc_executor.execute_with_monitoring(
+                chunk_command, context.temp_dir, context.config.memory_limit, 
+                context.config.timeout, chunk_id
+            )
+            
+            if chunk_success and chunk_output_path.exists():
+                logger.info(f"Successfully processed chunk {chunk_id}")
+                return ChunkResult(chunk_id=chunk_id, success=True, output_path=chunk_output_path)
+            
+            logger.warning(f"Failed to process chunk {chunk_id}")
+            return ChunkResult(chunk_id=chunk_id, success=False)
+                
+        except Exception as chunk_error:
+            logger.error(f"Error processing chunk {chunk_id}: {chunk_error}")
+            return ChunkResult(chunk_id=chunk_id, success=False, error=str(chunk_error))
@@ -0,0 +1,34 @@
+import logging
+import shutil
+from .base import ProcessingStrategy
+from ..models import ProcessingContext, ProcessingResult, ProcessingMethod, get_output_extension
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class IdentityStrategy(ProcessingStrategy):
+    """Strategy for conversions whose output format is the input's own format"""
+    
+    def process(self, context: ProcessingContext) -> ProcessingResult:
+        """Hand the input back as the output without running pandoc"""
+        try:
+            logger.info(f"Input already in {context.output_format} format, skipping pandoc: {context.input_info.filename}")
+            
+            output_extension = get_output_extension(context.output_format)
+            output_path = context.output_dir / f"{context.input_info.path.stem}.{output_extension}"
+            shutil.move(str(context.input_info.path), str(output_path))
+            
+            return ProcessingResult(
+                success=True,
+                output_path=output_path,
+                method=ProcessingMethod.IDENTITY
+            )
+            
+        except Exception as e:
+            logger.error(f"Identity processing failed: {e}")
+            return ProcessingResult(
+                success=False,
+                method=ProcessingMethod.IDENTITY,
+                error=str(e)
+            )
@@ -26,7 +26,7 @@ class SingleFileStrategy(ProcessingStrategy):
             # Build output path with proper extension mapping
             output_extension = get_output_extension(context.output_format)
             output_filename = f"{context.input_info.path.stem}.{output_extension}"
-            output_path = context.temp_dir / output_filename
+            output_path = context.output_dir / output_filename
             
             # Build pandoc command
             command = self.pandoc_executor.build_command(
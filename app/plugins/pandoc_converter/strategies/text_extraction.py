@@ -28,7 +28,7 @@ class TextExtractionStrategy(ProcessingStrategy):
             
             # Extract text directly
             output_path = self.text_extractor.extract_from_html(
-                context.input_info.path, output_extension, context.temp_dir
+                context.input_info.path, output_extension, context.output_dir
             )
             
             # Final memory check
@@ -8,12 +8,12 @@ import logging
 import uuid
 import time
 from pydantic import BaseModel, Field
-from ...models.plugin import BasePlugin, BasePluginResponse
+from ...models.plugin import BasePlugin, BasePluginResponse, FileResult
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-class Pdf2HtmlResponse(BasePluginResponse):
+class Pdf2HtmlResponse(FileResult):
     """Pydantic model for PDF to HTML converter plugin response"""
     file_path: str = Field(..., description="Path to the converted HTML file")
     file_name: str = Field(..., description="Name of the converted HTML file")
@@ -1,5 +1,5 @@
 import xml.etree.ElementTree as ET
-from typing import List, Union, Optional, Literal
+from typing import Annotated, List, Union, Optional, Literal
 from pydantic import BaseModel, Field
 
 # --- Define the building blocks (nodes) for content ---
@@ -28,8 +28,12 @@ class RawHtmlNode(BaseNode):
     type: Literal["raw_html"] = "raw_html"
     content: str
     
-# A Union type for any inline content that can appear within a paragraph or heading.
-InlineContent = Union[TextNode, EmphasisNode, StructuralNode, RawHtmlNode]
+# A Union type for any inline content that can appear within a paragraph or heading,
+# tagged on `type` so validation goes straight to the matching node model.
+InlineContent = Annotated[
+    Union[TextNode, EmphasisNode, StructuralNode, RawHtmlNode],
+    Field(discriminator="type")
+]
 
 # --- Define the main block-level components of the document ---
 
@@ -60,8 +64,11 @@ class QuoteNode(BaseBlock):
     type: Literal["quote"] = "quote"
     content: List['ContentBlock']
 
-# A Union type for any block-level content.
-ContentBlock = Union[HeadingNode, ParagraphNode, DivNode, QuoteNode, RawHtmlNode, StructuralNode]
+# A Union type for any block-level content, tagged on `type` like InlineContent.
+ContentBlock = Annotated[
+    Union[HeadingNode, ParagraphNode, DivNode, QuoteNode, RawHtmlNode, StructuralNode],
+    Field(discriminator="type")
+]
 
 # Update forward references for nested models
 DivNode.model_rebuild()
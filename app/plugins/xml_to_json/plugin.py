@@ -3,7 +3,7 @@ from typing import List, Union, Optional, Dict, Any, Type
 import tempfile
 from pathlib import Path
 from pydantic import BaseModel, Field
-from ...models.plugin import BasePlugin, BasePluginResponse
+from ...models.plugin import BasePlugin, BasePluginResponse, FileResult
 
 from .models import (
     PrincipiaDocument, DocumentMetadata, ContentBlock, InlineContent,
@@ -71,7 +71,7 @@ def create_structured_dataset(xml_content: str) -> PrincipiaDocument:
     return PrincipiaDocument(metadata=metadata, body=parsed_body)
 
 
-class XmlToJsonResponse(BasePluginResponse):
+class XmlToJsonResponse(FileResult):
     """Pydantic model for XML to JSON converter plugin response"""
     file_path: str = Field(..., description="Path to the converted JSON file")
     file_name: str = Field(..., description="Name of the converted JSON file")
@@ -90,7 +90,7 @@ class Plugin(BasePlugin):
         if not file_info:
             raise ValueError("Missing XML file input")
 
-        xml_content = file_info["content"].decode("utf-8")
+        xml_content = self.read_input_file(file_info).decode("utf-8")
         structured_doc = create_structured_dataset(xml_content)
         
         json_output = structured_doc.model_dump_json(indent=2)
@@ -0,0 +1,22 @@
+import orjson
+
+from app.core.plugin_manager import PluginManager
+
+
+def test_plugin_listing_reports_compliance(tmp_path):
+    manager = PluginManager(status_cache_file=str(tmp_path / "plugin_status_cache.json"))
+    
+    payload = orjson.loads(manager.get_plugins_json())
+    
+    assert payload["success"] is True
+    assert payload["plugins"]
+    assert payload["count"] == len(payload["plugins"])
+    for plugin in payload["plugins"]:
+        assert plugin["compliance_status"] is not None, plugin["id"]
+        assert isinstance(plugin["compliance_status"]["compliant"], bool)
+
+
+def test_plugin_listing_is_reused_until_plugins_change(tmp_path):
+    manager = PluginManager(status_cache_file=str(tmp_path / "plugin_status_cache.json"))
+    
+    assert manager.get_plugins_json() is manager.get_plugins_json()